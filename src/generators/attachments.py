@@ -7,14 +7,22 @@ documents, screenshots, reports, and other common artifacts.
 
 from __future__ import annotations
 
+import logging
 import random
-import re
-from typing import List, Dict
+import string
+from functools import lru_cache
+from itertools import product
+from typing import Iterator, List, Dict
 
+import numpy as np
 from tqdm import tqdm  # ✅ ADDED
 
-from utils.random_utils import generate_uuid
-from utils.date_utils import random_date
+from models import Table
+from utils.random_utils import generate_uuid_batch
+from utils.date_utils import random_dates
+
+
+logger = logging.getLogger(__name__)
 
 
 _FILE_TYPE_MAP = {
@@ -36,90 +44,137 @@ _FILE_NAME_SUFFIXES = [
     "review",
 ]
 
+_FILE_EXTS = tuple(_FILE_TYPE_MAP)
+_SUFFIXES = tuple(_FILE_NAME_SUFFIXES)
+_NAME_COMBOS = tuple(product(_SUFFIXES, _FILE_EXTS))
+
+_COLUMNS = (
+    "attachment_id",
+    "task_id",
+    "file_name",
+    "file_type",
+    "file_size_kb",
+    "uploaded_at",
+    "url",
+)
+
+# Tasks per generation chunk
+_TASK_CHUNK_SIZE = 5000
+
 _AVG_SIZE_RANGE_KB = (500, 2500)
 _MAX_SIZE_RANGE_KB = (50, 5000)
 
 
+class _UnderscoreTable(dict):
+    """str.translate table mapping any character not listed to '_'."""
+
+    def __missing__(self, key: int) -> str:
+        return "_"
+
+
+_SANITIZE_TABLE = _UnderscoreTable({i: "_" for i in range(256)})
+_SANITIZE_TABLE.update({ord(c): c for c in string.ascii_lowercase + string.digits})
+
+
+@lru_cache(maxsize=4096)
 def _sanitize_name(name: str) -> str:
     """Convert task name into a filesystem-friendly base name."""
-    name = name.lower()
-    name = re.sub(r"[^a-z0-9]+", "_", name)
-    return name.strip("_")
+    name = name.lower().translate(_SANITIZE_TABLE)
+    return "_".join(part for part in name.split("_") if part)
+
+
+def _attachments_for_tasks(tasks: List[Dict]) -> Table:
+    """Generate the attachments for one chunk of tasks."""
+    # About half of all tasks carry attachments
+    keep = np.random.random(len(tasks)) <= 0.5
+    selected_tasks = [
+        task
+        for task in map(tasks.__getitem__, np.flatnonzero(keep).tolist())
+        if task.get("created_at") and task.get("due_date")
+    ]
+    counts = np.random.randint(1, 4, size=len(selected_tasks)).tolist()
+
+    total = sum(counts)
+    if not total:
+        return Table.empty(_COLUMNS)
+
+    # Bulk-draw sizes and upload dates for every attachment at once
+    sizes = np.random.randint(
+        _AVG_SIZE_RANGE_KB[0], _AVG_SIZE_RANGE_KB[1] + 1, size=total
+    ).astype(np.int32)
+    big_mask = np.random.random(total) < 0.15
+    sizes[big_mask] = np.random.randint(
+        _MAX_SIZE_RANGE_KB[0], _MAX_SIZE_RANGE_KB[1] + 1, size=int(big_mask.sum())
+    )
+
+    uploaded_dates = random_dates(
+        np.repeat([task["created_at"] for task in selected_tasks], counts),
+        np.repeat([task["due_date"] for task in selected_tasks], counts),
+    )
+
+    attachment_ids = generate_uuid_batch("att", total)
+    task_ids: List[str] = []
+    file_names: List[str] = []
+    file_types: List[str] = []
+
+    for task, num_attachments in zip(selected_tasks, counts):
+        task_id = task["task_id"]
+        base_name = _sanitize_name(task.get("name", "task"))
 
+        # Sampling distinct (suffix, ext) pairs keeps names unique per task
+        for suffix, ext in random.sample(_NAME_COMBOS, k=num_attachments):
+            task_ids.append(task_id)
+            file_names.append(f"{base_name}_{suffix}{ext}")
+            file_types.append(_FILE_TYPE_MAP[ext])
 
-def _generate_file_name(task_name: str) -> str:
-    """Generate a realistic file name derived from task name."""
-    base = _sanitize_name(task_name)
-    suffix = random.choice(_FILE_NAME_SUFFIXES)
-    ext = random.choice(list(_FILE_TYPE_MAP.keys()))
-    return f"{base}_{suffix}{ext}"
+    return Table(
+        {
+            "attachment_id": attachment_ids,
+            "task_id": task_ids,
+            "file_name": file_names,
+            "file_type": file_types,
+            "file_size_kb": sizes,
+            "uploaded_at": uploaded_dates,
+            "url": [f"https://example.com/files/{name}" for name in file_names],
+        }
+    )
 
 
-def generate_attachments(tasks: List[Dict]) -> List[Dict]:
+def iter_attachments(tasks: List[Dict]) -> Iterator[Table]:
     """
-    Generate realistic attachments for a subset of tasks.
+    Yield attachment Tables, one per chunk of ``_TASK_CHUNK_SIZE`` tasks.
+
+    Yields:
+        Column-oriented Tables of attachments, one per task chunk.
     """
-    if not tasks:
-        return []
+    generated = 0
 
-    random.seed(42)
+    # ✅ tqdm added to task chunk loop
+    for start in tqdm(
+        range(0, len(tasks), _TASK_CHUNK_SIZE),
+        desc="Generating attachments (task chunks)",
+    ):
+        attachments = _attachments_for_tasks(tasks[start : start + _TASK_CHUNK_SIZE])
+        generated += len(attachments)
+        yield attachments
 
-    attachments: List[Dict] = []
+    logger.info("[✅] Generated %s attachments successfully.", f"{generated:,}")
 
-    # ✅ tqdm added to task loop
-    for task in tqdm(tasks, desc="Generating attachments (tasks)"):
-        if random.random() > 0.5:
-            continue
 
-        task_id = task["task_id"]
-        task_name = task.get("name", "task")
-        created_at = task.get("created_at")
-        due_date = task.get("due_date")
-
-        if not created_at or not due_date:
-            continue
-
-        num_attachments = random.randint(1, 3)
-        used_names = set()
-
-        # ✅ tqdm added to per-task attachment loop
-        for _ in tqdm(
-            range(num_attachments),
-            desc=f"Attachments for {task_id}",
-            leave=False,
-        ):
-            file_name = _generate_file_name(task_name)
-            while file_name in used_names:
-                file_name = _generate_file_name(task_name)
-            used_names.add(file_name)
-
-            ext = "." + file_name.split(".")[-1]
-            mime_type = _FILE_TYPE_MAP.get(ext, "application/octet-stream")
-
-            file_size_kb = random.randint(*_AVG_SIZE_RANGE_KB)
-            if random.random() < 0.15:
-                file_size_kb = random.randint(*_MAX_SIZE_RANGE_KB)
-
-            uploaded_at = random_date(created_at, due_date)
-
-            attachments.append(
-                {
-                    "attachment_id": generate_uuid("att"),
-                    "task_id": task_id,
-                    "file_name": file_name,
-                    "file_type": mime_type,
-                    "file_size_kb": file_size_kb,
-                    "uploaded_at": uploaded_at,
-                    "url": f"https://example.com/files/{file_name}",
-                }
-            )
-
-    print(f"[✅] Generated {len(attachments):,} attachments successfully.")
-    return attachments
+def generate_attachments(tasks: List[Dict]) -> Table:
+    """
+    Generate realistic attachments for a subset of tasks.
+
+    Returns:
+        Column-oriented Table of attachments ready for DB insertion.
+    """
+    return Table.concat(iter_attachments(tasks), _COLUMNS)
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     fake_tasks = [
         {
@@ -135,5 +190,5 @@ if __name__ == "__main__":
 
     print("=== attachments generator demo ===")
     print(f"Generated {len(generated_attachments)} attachments")
-    for att in generated_attachments[:3]:
+    for att in generated_attachments.to_records()[:3]:
         print(att)
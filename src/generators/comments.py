@@ -7,16 +7,25 @@ updates, and feedback with proper temporal consistency.
 
 from __future__ import annotations
 
+import logging
 import random
-from typing import List, Dict
+from typing import Iterator, List, Dict
 
+import numpy as np
 from tqdm import tqdm  # ✅ ADDED
 
-from utils.random_utils import generate_uuid, random_bool
-from utils.date_utils import random_date, ensure_chronology
-from utils.llm_helper import generate_text
+from models import Comment
+from utils.random_utils import generate_uuid_batch
+from utils.date_utils import random_dates
+from utils.llm_helper import LLM_ENABLED, generate_text_batch
 
 
+logger = logging.getLogger(__name__)
+
+
+# Tasks per generation chunk (and per LLM batch call)
+_TASK_CHUNK_SIZE = 2000
+
 _FALLBACK_COMMENTS = [
     "Let's revisit this after the review meeting.",
     "Great progress here!",
@@ -31,80 +40,110 @@ _FALLBACK_COMMENTS = [
 ]
 
 
-def _generate_comment_text(task_name: str) -> str:
-    """Generate comment text via LLM with safe fallback."""
-    prompt = (
+def _comment_prompt(task_name: str) -> str:
+    """Build the LLM prompt for a comment on the given task."""
+    return (
         f"Write a short (1–2 sentence) Asana comment about the task "
         f"'{task_name}', reflecting realistic team collaboration."
     )
-    try:
-        return generate_text(prompt)
-    except Exception:
-        return random.choice(_FALLBACK_COMMENTS)
 
 
-def generate_comments(
-    tasks: List[Dict],
-    users: List[Dict],
-) -> List[Dict]:
-    """
-    Generate realistic comments for a subset of tasks.
-    """
-    if not tasks or not users:
-        return []
+def _comments_for_tasks(tasks: List[Dict], users: List[Dict]) -> List[Comment]:
+    """Generate the comments for one chunk of tasks."""
+    comments: List[Comment] = []
+    prompts: List[str] = []
 
-    random.seed(42)
+    # Roughly 70% of tasks get comments
+    keep = np.random.random(len(tasks)) < 0.7
+    selected_tasks = [
+        task
+        for task in map(tasks.__getitem__, np.flatnonzero(keep).tolist())
+        if task.get("created_at") and task.get("due_date")
+    ]
+    counts = np.random.randint(1, 7, size=len(selected_tasks)).tolist()
 
-    comments: List[Dict] = []
+    total = sum(counts)
+    if not total:
+        return comments
 
-    # ✅ tqdm added to task loop
-    for task in tqdm(tasks, desc="Generating comments (tasks)"):
-        if not random_bool(0.7):
-            continue
+    # Comment dates fall within each task's [created_at, due_date]
+    user_idx = np.random.randint(0, len(users), size=total).tolist()
+    created_dates = random_dates(
+        np.repeat([task["created_at"] for task in selected_tasks], counts),
+        np.repeat([task["due_date"] for task in selected_tasks], counts),
+    )
+    edited_flags = (np.random.random(total) < 0.2).tolist()
+    comment_ids = generate_uuid_batch("com", total)
 
+    idx = 0
+
+    for task, num_comments in zip(selected_tasks, counts):
         task_id = task["task_id"]
         task_name = task.get("name", "Task")
-        created_at = task.get("created_at")
-        due_date = task.get("due_date")
 
-        if not created_at or not due_date:
-            continue
+        for _ in range(num_comments):
+            comments.append(
+                Comment(
+                    comment_id=comment_ids[idx],
+                    task_id=task_id,
+                    user_id=users[user_idx[idx]]["user_id"],
+                    text=None,
+                    created_at=created_dates[idx],
+                    is_edited=edited_flags[idx],
+                )
+            )
+            if LLM_ENABLED:
+                prompts.append(_comment_prompt(task_name))
+            idx += 1
 
-        num_comments = random.randint(1, 6)
+    texts = generate_text_batch(prompts) if LLM_ENABLED else [None] * len(comments)
+    for comment, text in zip(comments, texts):
+        comment.text = text or random.choice(_FALLBACK_COMMENTS)
 
-        # ✅ tqdm added to per-task comment loop
-        for _ in tqdm(
-            range(num_comments),
-            desc=f"Comments for {task_id}",
-            leave=False,
-        ):
-            user = random.choice(users)
+    return comments
 
-            comment_created = random_date(created_at, due_date)
 
-            dates = ensure_chronology(
-                created_at=created_at,
-                due_date=comment_created,
-                completed_at=None,
-            )
+def iter_comments(
+    tasks: List[Dict],
+    users: List[Dict],
+) -> Iterator[Comment]:
+    """
+    Yield comments for a subset of tasks, with one LLM batch per task chunk.
 
-            comments.append(
-                {
-                    "comment_id": generate_uuid("com"),
-                    "task_id": task_id,
-                    "user_id": user["user_id"],
-                    "text": _generate_comment_text(task_name),
-                    "created_at": dates["due_date"],
-                    "is_edited": random_bool(0.2),
-                }
-            )
+    Yields:
+        Comment records ready for DB insertion.
+    """
+    if not tasks or not users:
+        return
 
-    print(f"[✅] Generated {len(comments):,} comments successfully.")
-    return comments
+    generated = 0
+
+    # ✅ tqdm added to task chunk loop
+    for start in tqdm(
+        range(0, len(tasks), _TASK_CHUNK_SIZE),
+        desc="Generating comments (task chunks)",
+    ):
+        comments = _comments_for_tasks(tasks[start : start + _TASK_CHUNK_SIZE], users)
+        generated += len(comments)
+        yield from comments
+
+    logger.info("[✅] Generated %s comments successfully.", f"{generated:,}")
+
+
+def generate_comments(
+    tasks: List[Dict],
+    users: List[Dict],
+) -> List[Comment]:
+    """
+    Generate realistic comments for a subset of tasks.
+    """
+    return list(iter_comments(tasks, users))
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     fake_tasks = [
         {
@@ -7,13 +7,19 @@ feed into task-level custom_field_values.
 
 from __future__ import annotations
 
+import logging
 import json
 import random
+from itertools import accumulate
 from typing import List, Dict, Optional
 
 from tqdm import tqdm  # ✅ ADDED
 
-from utils.random_utils import generate_uuid
+from models import CustomField
+from utils.random_utils import generate_uuid_batch
+
+
+logger = logging.getLogger(__name__)
 
 
 _CUSTOM_FIELD_POOL = [
@@ -49,6 +55,19 @@ _CUSTOM_FIELD_POOL = [
     {"name": "Budget Allocation", "type": "number", "possible_values": None},
 ]
 
+# Pool with possible_values already serialized for the DB, built once
+_POOL_SERIALIZED = [
+    dict(
+        field,
+        possible_values=(
+            json.dumps(field["possible_values"])
+            if field["possible_values"] is not None
+            else None
+        ),
+    )
+    for field in _CUSTOM_FIELD_POOL
+]
+
 
 _TYPE_WEIGHTS = {
     "number": 40,
@@ -57,15 +76,16 @@ _TYPE_WEIGHTS = {
 }
 
 
+_TYPE_CHOICES = tuple(_TYPE_WEIGHTS)
+_TYPE_CUM_WEIGHTS = tuple(accumulate(_TYPE_WEIGHTS.values()))
+
+
 def _weighted_type_choice() -> str:
     """Choose a custom field type using weighted distribution."""
-    choices = []
-    for field_type, weight in _TYPE_WEIGHTS.items():
-        choices.extend([field_type] * weight)
-    return random.choice(choices)
+    return random.choices(_TYPE_CHOICES, cum_weights=_TYPE_CUM_WEIGHTS, k=1)[0]
 
 
-def generate_custom_fields(projects: List[Dict]) -> List[Dict]:
+def generate_custom_fields(projects: List[Dict]) -> List[CustomField]:
     """
     Generate realistic custom fields for each project.
 
@@ -73,53 +93,53 @@ def generate_custom_fields(projects: List[Dict]) -> List[Dict]:
         projects: List of project dictionaries.
 
     Returns:
-        List of custom field dictionaries ready for DB insertion.
+        List of CustomField records ready for DB insertion.
     """
     if not projects:
         return []
 
-    random.seed(42)
+    custom_fields: List[CustomField] = []
 
-    custom_fields: List[Dict] = []
+    # Size every project's field set up front so IDs can be drawn in one batch
+    counts = [
+        min(random.randint(2, 5), len(_CUSTOM_FIELD_POOL)) for _ in projects
+    ]
+    field_ids = generate_uuid_batch("cf", sum(counts))
 
     # ✅ tqdm added to project loop
-    for project in tqdm(projects, desc="Generating custom fields (projects)"):
+    for project, num_fields in tqdm(
+        zip(projects, counts),
+        total=len(projects),
+        desc="Generating custom fields (projects)",
+    ):
         project_id = project["project_id"]
 
-        num_fields = random.randint(2, 5)
         selected_pool = random.sample(
-            _CUSTOM_FIELD_POOL,
-            k=min(num_fields, len(_CUSTOM_FIELD_POOL)),
+            _POOL_SERIALIZED,
+            k=num_fields,
         )
 
-        # ✅ tqdm added to per-project field loop
-        for field in tqdm(
-            selected_pool,
-            desc=f"Custom fields for {project_id}",
-            leave=False,
-        ):
-            field_type = field["type"]
-
+        for field in selected_pool:
             custom_fields.append(
-                {
-                    "custom_field_id": generate_uuid("cf"),
-                    "project_id": project_id,
-                    "name": field["name"],
-                    "type": field_type,
-                    "possible_values": (
-                        json.dumps(field["possible_values"])
-                        if field.get("possible_values") is not None
-                        else None
-                    ),
-                }
+                CustomField(
+                    custom_field_id=field_ids[len(custom_fields)],
+                    project_id=project_id,
+                    name=field["name"],
+                    type=field["type"],
+                    possible_values=field["possible_values"],
+                )
             )
 
-    print(f"[✅] Generated {len(custom_fields):,} custom fields successfully.")
+    logger.info(
+        "[✅] Generated %s custom fields successfully.", f"{len(custom_fields):,}"
+    )
     return custom_fields
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     fake_projects = [{"project_id": f"proj_{i}"} for i in range(3)]
 
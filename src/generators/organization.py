@@ -7,14 +7,18 @@ using the simulated Asana workspace.
 
 from __future__ import annotations
 
+import logging
 import random
-import re
+import string
 from typing import Dict
 
 from utils.random_utils import generate_uuid
 from utils.date_utils import random_date
 
 
+logger = logging.getLogger(__name__)
+
+
 _INDUSTRIES = [
     "Software",
     "Software",
@@ -44,10 +48,20 @@ _FALLBACK_DESCRIPTIONS = [
 ]
 
 
+class _DeleteTable(dict):
+    """str.translate table deleting any character not listed."""
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+_DOMAIN_TABLE = _DeleteTable({i: None for i in range(256)})
+_DOMAIN_TABLE.update({ord(c): c for c in string.ascii_lowercase + string.digits})
+
+
 def _generate_domain(company_name: str) -> str:
     """Generate an email domain from a company name."""
-    base = company_name.lower()
-    base = re.sub(r"[^a-z0-9]", "", base)
+    base = company_name.lower().translate(_DOMAIN_TABLE)
     return f"{base}.io"
 
 
@@ -63,8 +77,6 @@ def generate_organization(
     Returns:
         Organization dictionary ready for DB insertion.
     """
-    random.seed(42)
-
     org = {
         "org_id": generate_uuid("org"),
         "name": company_name,
@@ -76,12 +88,14 @@ def generate_organization(
         "domain": _generate_domain(company_name),
     }
 
-    print("[✅] Organization generated successfully.")
+    logger.info("[✅] Organization generated successfully.")
     return org
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     org = generate_organization("TaskNexus Inc.")
 
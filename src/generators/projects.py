@@ -7,17 +7,20 @@ statuses, and SaaS-relevant names and descriptions.
 
 from __future__ import annotations
 
+import logging
 import random
-from typing import List, Dict
+from itertools import accumulate
+from typing import List, Dict, Optional
 
-from tqdm import tqdm  # ✅ ADDED
-
-from utils.random_utils import generate_uuid, weighted_choice
-from utils.date_utils import random_date, ensure_chronology
-from utils.llm_helper import generate_text
+from utils.random_utils import generate_uuid_batch
+from utils.date_utils import random_dates
+from utils.llm_helper import LLM_ENABLED, generate_text_batch
 from scrapers.company_scraper import get_departments
 
 
+logger = logging.getLogger(__name__)
+
+
 _PROJECT_NAMES = [
     "Growth Analytics Platform",
     "Mobile Redesign Sprint",
@@ -39,6 +42,8 @@ _STATUS_WEIGHTS = {
     "Not Started": 5,
 }
 
+_STATUS_CHOICES = tuple(_STATUS_WEIGHTS)
+_STATUS_CUM_WEIGHTS = tuple(accumulate(_STATUS_WEIGHTS.values()))
 
 _FALLBACK_DESCRIPTIONS = [
     "Build a scalable internal solution aligned with business objectives.",
@@ -48,16 +53,12 @@ _FALLBACK_DESCRIPTIONS = [
 ]
 
 
-def _generate_description(project_name: str, department: str) -> str:
-    """Generate a project description using LLM or fallback text."""
-    prompt = (
+def _description_prompt(project_name: str, department: str) -> str:
+    """Build the LLM prompt for a project description."""
+    return (
         f"Write a concise project description for a {department} project "
         f"named '{project_name}' in a B2B SaaS company."
     )
-    try:
-        return generate_text(prompt)
-    except Exception:
-        return random.choice(_FALLBACK_DESCRIPTIONS)
 
 
 def generate_projects(
@@ -66,70 +67,78 @@ def generate_projects(
 ) -> List[Dict]:
     """
     Generate realistic projects for each team.
+
+    Args:
+        teams: Teams that own the projects.
+        company_name: Company name.
     """
     if not teams:
         raise ValueError("Teams list cannot be empty")
 
-    random.seed(42)
-
-    projects: List[Dict] = []
-
-    # ✅ tqdm added to team loop
-    for team in tqdm(teams, desc="Generating projects (teams)"):
-        team_id = team["team_id"]
-        department = team.get("department") or random.choice(get_departments())
-
-        num_projects = random.randint(3, 12)
+    # Resolve each team's department and project count
+    departments: List[str] = []
+    counts: List[int] = []
+    for team in teams:
+        departments.append(team.get("department") or random.choice(get_departments()))
+        counts.append(random.randint(3, 12))
+
+    # Bulk-draw the created -> start -> end timeline
+    total = sum(counts)
+    created_dates = random_dates("2021-01-01", "2025-01-01", size=total)
+    start_dates = random_dates(created_dates, "2025-06-30")
+    end_dates = random_dates(start_dates, "2025-12-31")
+    statuses = random.choices(
+        _STATUS_CHOICES, cum_weights=_STATUS_CUM_WEIGHTS, k=total
+    )
 
-        # ✅ tqdm added to per-team project loop
-        for _ in tqdm(
-            range(num_projects),
-            desc=f"Projects for {team_id}",
-            leave=False,
-        ):
-            project_name = random.choice(_PROJECT_NAMES)
-            status = weighted_choice(_STATUS_WEIGHTS)
+    project_ids = generate_uuid_batch("proj", total)
 
-            created_at = random_date("2021-01-01", "2025-01-01")
+    projects: List[Dict] = []
+    idx = 0
 
-            start_date = random_date(
-                created_at,
-                "2025-06-30",
-            )
+    for team, department, num_projects in zip(teams, departments, counts):
+        for _ in range(num_projects):
+            status = statuses[idx]
 
             end_date = None
             if status in {"Completed", "Active"}:
-                end_date = random_date(start_date, "2025-12-31")
-
-            dates = ensure_chronology(
-                created_at=created_at,
-                due_date=end_date,
-                completed_at=None,
-            )
+                end_date = end_dates[idx]
 
             projects.append(
                 {
-                    "project_id": generate_uuid("proj"),
-                    "team_id": team_id,
+                    "project_id": project_ids[idx],
+                    "team_id": team["team_id"],
                     "department": department,
-                    "name": project_name,
-                    "description": _generate_description(
-                        project_name,
-                        department,
-                    ),
+                    "name": random.choice(_PROJECT_NAMES),
+                    "description": None,
                     "status": status,
-                    "start_date": start_date,
-                    "end_date": dates["due_date"],
-                    "created_at": created_at,
+                    "start_date": start_dates[idx],
+                    "end_date": end_date,
+                    "created_at": created_dates[idx],
                 }
             )
-
-    print(f"[✅] Generated {len(projects):,} projects successfully.")
+            idx += 1
+
+    descriptions: List[Optional[str]] = [None] * len(projects)
+    if LLM_ENABLED:
+        prompts = [
+            _description_prompt(project["name"], project["department"])
+            for project in projects
+        ]
+        descriptions = generate_text_batch(prompts, cache=True)
+    for project, description in zip(projects, descriptions):
+        project["description"] = description or random.choice(
+            _FALLBACK_DESCRIPTIONS
+        )
+
+    logger.info("[✅] Generated %s projects successfully.", f"{len(projects):,}")
     return projects
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     fake_teams = [
         {"team_id": f"team_{i}", "department": "Engineering"} for i in range(3)
@@ -7,13 +7,18 @@ realistic Asana-style task pipelines.
 
 from __future__ import annotations
 
-import random
-from typing import List, Dict
+import logging
+from typing import List, Dict, Tuple
 
+import numpy as np
 from tqdm import tqdm  # ✅ ADDED
 
-from utils.random_utils import generate_uuid
-from utils.date_utils import random_date
+from models import Section
+from utils.random_utils import generate_uuid_batch
+from utils.date_utils import add_random_offsets
+
+
+logger = logging.getLogger(__name__)
 
 
 _DEFAULT_SECTIONS = [
@@ -42,16 +47,20 @@ _MARKETING_DESIGN_SECTIONS = [
 ]
 
 
-def _choose_section_template(department: str | None) -> List[str]:
-    """Choose section template based on department."""
-    if department in {"Engineering", "Product"}:
-        return _ENGINEERING_SECTIONS
-    if department in {"Marketing", "Design"}:
-        return _MARKETING_DESIGN_SECTIONS
-    return _DEFAULT_SECTIONS
+# department -> (section template, min sections, max sections)
+_DEFAULT_LAYOUT: Tuple[List[str], int, int] = (_DEFAULT_SECTIONS, 3, 5)
+
+_DEPARTMENT_LAYOUTS: Dict[str, Tuple[List[str], int, int]] = {
+    "Engineering": (_ENGINEERING_SECTIONS, 5, 6),
+    "Product": (_ENGINEERING_SECTIONS, 5, 6),
+    "Marketing": (_MARKETING_DESIGN_SECTIONS, 4, 5),
+    "Design": (_MARKETING_DESIGN_SECTIONS, 4, 5),
+}
 
+_SECTION_SETUP_DAYS = 30
 
-def generate_sections(projects: List[Dict]) -> List[Dict]:
+
+def generate_sections(projects: List[Dict]) -> List[Section]:
     """
     Generate workflow sections for each project.
 
@@ -60,91 +69,62 @@ def generate_sections(projects: List[Dict]) -> List[Dict]:
                   project_id, department, and created_at.
 
     Returns:
-        List of section dictionaries ready for DB insertion.
+        List of Section records ready for DB insertion.
     """
     if not projects:
         return []
 
-    random.seed(42)
+    sections: List[Section] = []
+    base_dates: List[str | None] = []
 
-    sections: List[Dict] = []
+    layouts = [
+        _DEPARTMENT_LAYOUTS.get(project.get("department"), _DEFAULT_LAYOUT)
+        for project in projects
+    ]
+
+    # Bulk-draw every project's section count within its department range
+    lows = np.fromiter((low for _, low, _ in layouts), dtype=np.int64)
+    highs = np.fromiter((high for _, _, high in layouts), dtype=np.int64)
+    section_counts = np.random.randint(lows, highs + 1).tolist()
+    section_ids = generate_uuid_batch("sec", sum(section_counts))
 
     # ✅ tqdm added (NO logic change)
-    for project in tqdm(projects, desc="Generating sections (projects)"):
+    for project, (template, _, _), num_sections in tqdm(
+        zip(projects, layouts, section_counts),
+        total=len(projects),
+        desc="Generating sections (projects)",
+    ):
         project_id = project["project_id"]
-        department = project.get("department")
         project_created = project.get("created_at")
 
-        template = _choose_section_template(department)
-
-        if department in {"Engineering", "Product"}:
-            num_sections = random.randint(5, 6)
-        elif department in {"Marketing", "Design"}:
-            num_sections = random.randint(4, 5)
-        else:
-            num_sections = random.randint(3, 5)
-
         chosen_sections = template[:num_sections]
 
         for idx, name in enumerate(chosen_sections, start=1):
-            created_at = (
-                random_date(
-                    random_date(
-                        project_created,
-                        project_created,
-                    ),
-                    random_date(
-                        project_created,
-                        project_created,
-                    ),
+            sections.append(
+                Section(
+                    section_id=section_ids[len(sections)],
+                    project_id=project_id,
+                    name=name,
+                    position=idx,
+                    created_at=None,
                 )
-                if project_created
-                else None
             )
+            base_dates.append(project_created)
 
-            if project_created:
-                created_at = random_date(
-                    random_date(project_created, project_created),
-                    random_date(project_created, project_created),
-                )
-
-            # Simpler ±30-day logic
-            if project_created:
-                created_at = random_date(
-                    random_date(project_created, project_created),
-                    project_created,
-                )
-
-            # Final corrected version
-            if project_created:
-                created_at = random_date(
-                    project_created,
-                    random_date(project_created, project_created),
-                )
+    # Sections are set up within 30 days after their project is created
+    for section, created_at in zip(
+        sections, add_random_offsets(base_dates, 0, _SECTION_SETUP_DAYS)
+    ):
+        section.created_at = created_at
 
-            sections.append(
-                {
-                    "section_id": generate_uuid("sec"),
-                    "project_id": project_id,
-                    "name": name,
-                    "position": idx,
-                    "created_at": (
-                        random_date(
-                            project_created,
-                            project_created,
-                        )
-                        if project_created
-                        else None
-                    ),
-                }
-            )
-
-    print(f"[✅] Generated {len(sections):,} sections successfully.")
+    logger.info("[✅] Generated %s sections successfully.", f"{len(sections):,}")
     return sections
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     fake_projects = [
         {
@@ -7,15 +7,22 @@ proper temporal, status, and assignment logic.
 
 from __future__ import annotations
 
+import logging
 import random
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 
-from tqdm import tqdm  # ✅ ADDED
+import numpy as np
 
-from utils.random_utils import generate_uuid, weighted_choice, random_bool
-from utils.date_utils import random_date, ensure_chronology
-from utils.llm_helper import generate_text, load_prompts
+from models import Subtask
+from utils.random_utils import generate_uuid_batch, random_bool, random_user_ids
+from utils.date_utils import random_dates, ensure_chronology_bulk
+from utils.llm_helper import LLM_ENABLED, generate_text_batch, load_prompts
+from utils.parallel_utils import parallel_imap
+
+
+logger = logging.getLogger(__name__)
 
 
 _STATUS_WEIGHTS = {
@@ -24,6 +31,12 @@ _STATUS_WEIGHTS = {
     "Done": 35,
 }
 
+_STATUS_CHOICES = tuple(_STATUS_WEIGHTS)
+_STATUS_CUM_WEIGHTS = tuple(accumulate(_STATUS_WEIGHTS.values()))
+
+# Tasks per generation chunk; fixed so output does not depend on worker count
+_TASK_CHUNK_SIZE = 4000
+
 _FALLBACK_SUBTASK_NAMES = [
     "Write unit tests",
     "Review PR changes",
@@ -37,104 +50,212 @@ _FALLBACK_SUBTASK_NAMES = [
 ]
 
 
-def _generate_subtask_name() -> str:
+def _generate_subtask_name(rng: random.Random) -> str:
     """Generate a short, specific subtask name."""
-    return random.choice(_FALLBACK_SUBTASK_NAMES)
+    return rng.choice(_FALLBACK_SUBTASK_NAMES)
 
 
-def _generate_description(parent_name: str, subtask_name: str) -> str:
-    """Generate subtask description via LLM with fallback."""
-    prompt = (
+def _description_prompt(parent_name: str, subtask_name: str) -> str:
+    """Build the LLM prompt for a subtask description."""
+    return (
         f"Write a short Asana subtask description for '{subtask_name}' "
         f"related to parent task '{parent_name}'."
     )
-    try:
-        return generate_text(prompt)
-    except Exception:
-        return f"Subtask to {subtask_name.lower()} for parent task: {parent_name}."
 
 
-def generate_subtasks(
-    tasks: List[Dict],
-    users: List[Dict],
-) -> List[Dict]:
-    """
-    Generate realistic subtasks for a subset of tasks.
-    """
-    if not tasks:
-        return []
+def _fallback_description(parent_name: str, subtask_name: str) -> str:
+    """Template description used when the LLM yields nothing."""
+    return f"Subtask to {subtask_name.lower()} for parent task: {parent_name}."
 
-    random.seed(42)
 
-    subtasks: List[Dict] = []
+def _assemble_subtasks(chunk: Tuple) -> Tuple[List[Subtask], List[str]]:
+    """
+    Build subtask rows for one chunk of parents.
+
+    Completion dates arrive already chronology-corrected and are only kept
+    for subtasks that end up Done.
 
-    selected_tasks = [task for task in tasks if random_bool(0.5)]
+    Runs in a worker process, so all randomness comes from the chunk's own
+    seeded RNG rather than the global one.
 
-    # ✅ tqdm added to parent task loop
-    for parent in tqdm(selected_tasks, desc="Generating subtasks (parent tasks)"):
+    Returns:
+        Tuple of (subtask rows, parent name per row).
+    """
+    (
+        seed,
+        parents,
+        counts,
+        assignee_ids,
+        created_dates,
+        due_dates,
+        completed_dates,
+        statuses,
+    ) = chunk
+    rng = random.Random(seed)
+    subtask_ids = generate_uuid_batch("sub", len(created_dates))
+
+    subtasks: List[Subtask] = []
+    parent_names: List[str] = []
+    idx = 0
+
+    for parent, num_subtasks in zip(parents, counts):
         parent_status = parent.get("status", "To Do")
-        parent_created = parent.get("created_at")
-        parent_due = parent.get("due_date")
         parent_name = parent.get("name", "Parent Task")
 
-        if not parent_created or not parent_due:
-            continue
+        for _ in range(num_subtasks):
+            subtask_status = "Done" if parent_status == "Done" else statuses[idx]
+
+            completed = subtask_status == "Done"
+            completed_at: Optional[str] = completed_dates[idx] if completed else None
 
-        max_subtasks = 2 if parent_status == "Done" else 5
-        num_subtasks = random.randint(1, max_subtasks)
+            name = _generate_subtask_name(rng)
 
-        # ✅ tqdm added to per-parent subtask loop
-        for _ in tqdm(
-            range(num_subtasks),
-            desc=f"Subtasks for {parent['task_id']}",
-            leave=False,
-        ):
-            subtask_status = (
-                "Done" if parent_status == "Done" else weighted_choice(_STATUS_WEIGHTS)
+            subtasks.append(
+                Subtask(
+                    subtask_id=subtask_ids[idx],
+                    parent_task_id=parent["task_id"],
+                    assignee_id=assignee_ids[idx],
+                    name=name,
+                    description=None,
+                    status=subtask_status,
+                    completed=completed,
+                    created_at=created_dates[idx],
+                    due_date=due_dates[idx],
+                    completed_at=completed_at,
+                )
             )
+            parent_names.append(parent_name)
+            idx += 1
 
-            created_at = random_date(parent_created, parent_due)
-            due_date = random_date(created_at, parent_due)
+    return subtasks, parent_names
 
-            completed = subtask_status == "Done"
-            completed_at: Optional[str] = None
 
-            if completed:
-                completed_at = random_date(created_at, due_date)
+def _subtask_chunks(tasks: List[Dict], users: List[Dict]) -> Iterator[Tuple]:
+    """
+    Yield assembly inputs for fixed-size chunks of tasks.
+
+    All global-RNG draws for a chunk happen here, in the parent process, so
+    output is identical for any worker count.
+    """
+    base_seed = random.getrandbits(32)
+
+    for chunk_id, start in enumerate(range(0, len(tasks), _TASK_CHUNK_SIZE)):
+        selected_tasks = [
+            task for task in tasks[start : start + _TASK_CHUNK_SIZE] if random_bool(0.5)
+        ]
+
+        # Keep parents with a valid timeline and size their subtasks
+        parents: List[Dict] = []
+        counts: List[int] = []
+        for parent in selected_tasks:
+            if not parent.get("created_at") or not parent.get("due_date"):
+                continue
+            max_subtasks = 2 if parent.get("status", "To Do") == "Done" else 5
+            parents.append(parent)
+            counts.append(random.randint(1, max_subtasks))
+
+        # Empty chunks still flow through so the progress bar reaches its total
+        if not parents:
+            yield (base_seed + chunk_id, [], [], [], [], [], [], [])
+            continue
 
-            dates = ensure_chronology(
-                created_at=created_at,
-                due_date=due_date,
-                completed_at=completed_at,
+        # Bulk-draw the created -> due -> completed date chain
+        parent_created = np.repeat([p["created_at"] for p in parents], counts)
+        parent_due = np.repeat([p["due_date"] for p in parents], counts)
+        created_dates = random_dates(parent_created, parent_due)
+        due_dates = random_dates(created_dates, parent_due)
+        completed_dates = ensure_chronology_bulk(
+            created_dates,
+            due_dates,
+            random_dates(created_dates, due_dates),
+        )["completed_at"]
+        statuses = random.choices(
+            _STATUS_CHOICES, cum_weights=_STATUS_CUM_WEIGHTS, k=len(created_dates)
+        )
+
+        assignee_ids = random_user_ids(users, len(created_dates))
+
+        yield (
+            base_seed + chunk_id,
+            parents,
+            counts,
+            assignee_ids,
+            created_dates,
+            due_dates,
+            completed_dates,
+            statuses,
+        )
+
+
+def iter_subtasks(
+    tasks: List[Dict],
+    users: List[Dict],
+    workers: int = 1,
+) -> Iterator[Subtask]:
+    """
+    Yield subtasks for a subset of tasks, one task chunk at a time.
+
+    Args:
+        tasks: Parent tasks.
+        users: Candidate assignees.
+        workers: Worker processes used to assemble rows (1 = serial).
+
+    Yields:
+        Subtask records ready for DB insertion.
+    """
+    if not tasks:
+        return
+
+    generated = 0
+
+    # ✅ tqdm added to task chunk loop
+    for subtasks, parent_names in parallel_imap(
+        _assemble_subtasks,
+        _subtask_chunks(tasks, users),
+        workers=workers,
+        desc="Generating subtasks (task chunks)",
+        total=-(-len(tasks) // _TASK_CHUNK_SIZE),
+    ):
+        descriptions: List[Optional[str]] = [None] * len(subtasks)
+        if LLM_ENABLED:
+            prompts = [
+                _description_prompt(parent_name, subtask.name)
+                for parent_name, subtask in zip(parent_names, subtasks)
+            ]
+            descriptions = generate_text_batch(prompts, cache=True)
+        for parent_name, subtask, description in zip(
+            parent_names, subtasks, descriptions
+        ):
+            subtask.description = description or _fallback_description(
+                parent_name, subtask.name
             )
 
-            assignee_id: Optional[str] = None
-            if users and random_bool(0.8):
-                assignee_id = random.choice(users)["user_id"]
+        generated += len(subtasks)
+        yield from subtasks
 
-            name = _generate_subtask_name()
+    logger.info("[✅] Generated %s subtasks successfully.", f"{generated:,}")
 
-            subtasks.append(
-                {
-                    "subtask_id": generate_uuid("sub"),
-                    "parent_task_id": parent["task_id"],
-                    "assignee_id": assignee_id,
-                    "name": name,
-                    "description": _generate_description(parent_name, name),
-                    "status": subtask_status,
-                    "completed": completed,
-                    "created_at": dates["created_at"],
-                    "due_date": dates["due_date"],
-                    "completed_at": dates["completed_at"],
-                }
-            )
 
-    print(f"[✅] Generated {len(subtasks):,} subtasks successfully.")
-    return subtasks
+def generate_subtasks(
+    tasks: List[Dict],
+    users: List[Dict],
+    workers: int = 1,
+) -> List[Subtask]:
+    """
+    Generate realistic subtasks for a subset of tasks.
+
+    Args:
+        tasks: Parent tasks.
+        users: Candidate assignees.
+        workers: Worker processes used to assemble rows (1 = serial).
+    """
+    return list(iter_subtasks(tasks, users, workers=workers))
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     fake_tasks = [
         {
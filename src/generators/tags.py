@@ -7,14 +7,20 @@ to simulate Asana-style metadata labeling.
 
 from __future__ import annotations
 
+import logging
 import random
-from typing import List, Dict
+from typing import Dict, Iterator, List
 
+import numpy as np
 from tqdm import tqdm  # ✅ ADDED
 
+from models import Table
 from utils.random_utils import generate_uuid
 
 
+logger = logging.getLogger(__name__)
+
+
 _COLOR_PALETTE = [
     "red",
     "blue",
@@ -69,6 +75,11 @@ _SUGGESTED_TAG_NAMES = [
     "Optimization",
 ]
 
+_TASK_TAG_COLUMNS = ("task_id", "tag_id")
+
+# Task-tag rows per yielded chunk
+_PAIR_CHUNK_SIZE = 5000
+
 
 def generate_tags(num_tags: int = 40) -> List[Dict]:
     """
@@ -83,8 +94,6 @@ def generate_tags(num_tags: int = 40) -> List[Dict]:
     if num_tags <= 0:
         raise ValueError("num_tags must be a positive integer")
 
-    random.seed(42)
-
     tag_names = list(dict.fromkeys(_SUGGESTED_TAG_NAMES))
     if num_tags > len(tag_names):
         raise ValueError("num_tags exceeds available unique tag names")
@@ -103,17 +112,80 @@ def generate_tags(num_tags: int = 40) -> List[Dict]:
             }
         )
 
-    print(f"[✅] Generated {len(tags):,} tags successfully.")
+    logger.info("[✅] Generated %s tags successfully.", f"{len(tags):,}")
     return tags
 
 
-def assign_tags_to_tasks(
+def _sample_tag_pairs(
+    n_tasks: int,
+    n_tags: int,
+    max_tags_per_task: int,
+) -> np.ndarray:
+    """
+    Sample (task index, tag index) pairs, without replacement per task.
+
+    Each task draws 0..max_tags_per_task tags (capped at n_tags). Tags are
+    picked one column at a time for all tasks at once: column j draws a rank
+    among the n_tags - j tags still free in each row and maps it past the
+    tags already taken, so only O(n_tasks * k) values are drawn instead of
+    a full random key per task and tag.
+
+    Returns:
+        int32 array of shape (n_pairs, 2), ordered by task.
+    """
+    k = min(max_tags_per_task, n_tags)
+    counts = np.minimum(
+        np.random.randint(0, max_tags_per_task + 1, size=n_tasks), n_tags
+    )
+
+    tag_order = np.empty((n_tasks, k), dtype=np.intp)
+    for j in range(k):
+        tag_idx = np.random.randint(0, n_tags - j, size=n_tasks)
+        # Walk the taken tags in ascending order, skipping over each one
+        for taken in np.sort(tag_order[:, :j], axis=1).T:
+            tag_idx += tag_idx >= taken
+        tag_order[:, j] = tag_idx
+
+    keep = np.arange(k) < counts[:, None]
+    task_idx = np.broadcast_to(np.arange(n_tasks)[:, None], (n_tasks, k))[keep]
+
+    return np.column_stack((task_idx, tag_order[keep])).astype(np.int32)
+
+
+def _iter_task_tag_chunks(
+    tasks: List[Dict],
+    tags: List[Dict],
+    max_tags_per_task: int,
+) -> Iterator[Table]:
+    """Yield task-tag Tables of up to ``_PAIR_CHUNK_SIZE`` rows each."""
+    if not tasks or not tags:
+        return
+
+    pairs = _sample_tag_pairs(len(tasks), len(tags), max_tags_per_task)
+
+    task_ids = np.array([task["task_id"] for task in tasks], dtype=object)
+    tag_ids = np.array([tag["tag_id"] for tag in tags], dtype=object)
+
+    # ✅ tqdm added (NO logic change)
+    for start in tqdm(
+        range(0, len(pairs), _PAIR_CHUNK_SIZE), desc="Assigning tags to tasks"
+    ):
+        chunk = pairs[start : start + _PAIR_CHUNK_SIZE]
+        yield Table({"task_id": task_ids[chunk[:, 0]], "tag_id": tag_ids[chunk[:, 1]]})
+
+
+def iter_task_tags(
     tasks: List[Dict],
     tags: List[Dict],
     max_tags_per_task: int = 3,
-) -> List[Dict]:
+) -> Iterator[Table]:
     """
-    Assign tags to tasks, creating a task-tag mapping.
+    Lazily yield task-tag mappings as column-oriented chunks.
+
+    Pair indices are sampled up front as a compact int32 array; each chunk
+    gathers its ID columns with one fancy-index per column, so no per-row
+    dictionaries are built. Arguments are validated on call, before any
+    chunk is produced.
 
     Args:
         tasks: List of task dictionaries.
@@ -121,43 +193,44 @@ def assign_tags_to_tasks(
         max_tags_per_task: Maximum number of tags per task.
 
     Returns:
-        List of task-tag mapping dictionaries.
+        Iterator of Tables, up to ``_PAIR_CHUNK_SIZE`` rows each.
     """
-    if not tasks or not tags:
-        return []
-
     if max_tags_per_task < 0:
         raise ValueError("max_tags_per_task must be non-negative")
 
-    random.seed(42)
+    return _iter_task_tag_chunks(tasks, tags, max_tags_per_task)
 
-    task_tags: List[Dict] = []
 
-    # ✅ tqdm added (NO logic change)
-    for task in tqdm(tasks, desc="Assigning tags to tasks"):
-        num_tags = random.randint(0, max_tags_per_task)
-        if num_tags == 0:
-            continue
-
-        selected_tags = random.sample(
-            tags,
-            k=min(num_tags, len(tags)),
-        )
+def assign_tags_to_tasks(
+    tasks: List[Dict],
+    tags: List[Dict],
+    max_tags_per_task: int = 3,
+) -> Table:
+    """
+    Assign tags to tasks, creating a task-tag mapping.
 
-        for tag in selected_tags:
-            task_tags.append(
-                {
-                    "task_id": task["task_id"],
-                    "tag_id": tag["tag_id"],
-                }
-            )
+    Args:
+        tasks: List of task dictionaries.
+        tags: List of tag dictionaries.
+        max_tags_per_task: Maximum number of tags per task.
 
-    print(f"[✅] Assigned {len(task_tags):,} task-tag pairs successfully.")
+    Returns:
+        Column-oriented Table of task-tag mappings.
+    """
+    task_tags = Table.concat(
+        iter_task_tags(tasks, tags, max_tags_per_task), _TASK_TAG_COLUMNS
+    )
+
+    logger.info(
+        "[✅] Assigned %s task-tag pairs successfully.", f"{len(task_tags):,}"
+    )
     return task_tags
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     generated_tags = generate_tags(20)
     fake_tasks = [{"task_id": f"task_{i}"} for i in range(5)]
@@ -168,4 +241,4 @@ if __name__ == "__main__":
     print(f"Generated {len(generated_tags)} tags")
     print(f"Assigned {len(tagged_pairs)} task-tag pairs")
     print(generated_tags[:3])
-    print(tagged_pairs[:5])
+    print(tagged_pairs.to_records()[:5])
@@ -7,15 +7,21 @@ status/priority distributions, optional assignees, and rich text content.
 
 from __future__ import annotations
 
+import logging
 import random
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
 
+import numpy as np
 from tqdm import tqdm  # ✅ ADDED
 
-from utils.random_utils import generate_uuid, weighted_choice, random_bool
-from utils.date_utils import random_date, ensure_chronology
-from utils.llm_helper import generate_text, load_prompts
+from utils.random_utils import generate_uuid_batch, random_user_ids
+from utils.date_utils import random_dates, ensure_chronology_bulk
+from utils.llm_helper import LLM_ENABLED, generate_text_batch, load_prompts
+
+
+logger = logging.getLogger(__name__)
 
 
 _PRIORITY_WEIGHTS = {
@@ -45,32 +51,63 @@ _TECH_WORDS = [
     "reporting",
 ]
 
+_TECH_KEYS = frozenset({"feature", "product", "service", "component", "functionality"})
+
+# Distinct rendered names drawn from per generate_tasks call
+_NAME_POOL_SIZE = 4096
+
+
+class _TechWordMap(dict):
+    """format_map mapping that fills tech placeholders and keeps the rest."""
+
+    def __missing__(self, key: str) -> str:
+        if key in _TECH_KEYS:
+            return random.choice(_TECH_WORDS)
+        return f"{{{key}}}"
+
+
+_TECH_WORD_MAP = _TechWordMap()
+
+
+@lru_cache(maxsize=None)
+def _load_task_prompts(file_path: str) -> Tuple[str, ...]:
+    """Load task name templates once, skipping comment lines."""
+    return tuple(
+        prompt for prompt in load_prompts(file_path) if not prompt.startswith("#")
+    )
+
 
 def _render_prompt(template: str) -> str:
-    """Replace placeholder tokens with technical words."""
-    text = template
-    for key in ["feature", "product", "service", "component", "functionality"]:
-        text = text.replace(f"{{{key}}}", random.choice(_TECH_WORDS))
-    return text
+    """Replace placeholder tokens with technical words in a single pass."""
+    return template.format_map(_TECH_WORD_MAP)
 
 
-def _generate_task_name(prompts: List[str]) -> str:
+def _generate_task_name(prompts: Sequence[str]) -> str:
     """Generate an action-oriented task name."""
     template = random.choice(prompts)
     name = _render_prompt(template)
     return name.strip().rstrip(".")
 
 
-def _generate_description(project_name: str, task_name: str) -> str:
-    """Generate task description via LLM with safe fallback."""
-    prompt = (
+def _description_prompt(project_name: str, task_name: str) -> str:
+    """Build the LLM prompt for a task description."""
+    # Depends only on (project, task name), so the LLM cache hits often
+    return (
         f"Write a one-sentence Asana task description for project "
-        f"'{project_name}' about '{task_name}'."
+        f"'{project_name.strip()}' about '{task_name.strip()}'."
     )
-    try:
-        return generate_text(prompt)
-    except Exception:
-        return f"Complete the task: {task_name}."
+
+
+def _fallback_description(task_name: str) -> str:
+    """Template description used when the LLM yields nothing."""
+    return f"Complete the task: {task_name}."
+
+
+def _weights_to_probs(weights: Dict[str, int]) -> Tuple[List[str], np.ndarray]:
+    """Split a label -> weight mapping into labels and a probability vector."""
+    labels = list(weights)
+    probs = np.fromiter(weights.values(), dtype=np.float64)
+    return labels, probs / probs.sum()
 
 
 def generate_tasks(
@@ -84,80 +121,98 @@ def generate_tasks(
     if not projects:
         raise ValueError("Projects list cannot be empty")
 
-    random.seed(42)
-
     prompts_path = Path("prompts/task_prompts.txt")
-    prompts = load_prompts(str(prompts_path))
+    prompts = _load_task_prompts(str(prompts_path))
 
     tasks: List[Dict] = []
+    project_names: List[str] = []
 
     base_tasks_per_project = max(1, total_task_limit // max(1, len(projects)))
 
+    # Size every project up front, truncating once total_task_limit is hit
+    high = min(150, base_tasks_per_project * 2)
+    low = min(max(20, base_tasks_per_project // 2), high)
+    counts = np.random.randint(low, high + 1, size=len(projects))
+    if counts.sum() > total_task_limit:
+        logger.info("[✅] Task generation reached total_task_limit.")
+    tasks_before = np.cumsum(counts) - counts
+    counts = np.clip(total_task_limit - tasks_before, 0, counts).tolist()
+
+    # Bulk-draw statuses, priorities, timelines and assignees for all tasks
+    total = sum(counts)
+    status_labels, status_probs = _weights_to_probs(_STATUS_WEIGHTS)
+    priority_labels, priority_probs = _weights_to_probs(_PRIORITY_WEIGHTS)
+    statuses = np.random.choice(status_labels, size=total, p=status_probs).tolist()
+    priorities = np.random.choice(
+        priority_labels, size=total, p=priority_probs
+    ).tolist()
+
+    created_dates = random_dates("2021-01-01", "2025-01-01", size=total)
+    due_dates = random_dates(created_dates, "2025-12-31")
+    completed_flags = [status == "Done" for status in statuses]
+    completed_candidates = random_dates(due_dates, "2025-12-31")
+    completed_dates = [
+        date if completed else None
+        for date, completed in zip(completed_candidates, completed_flags)
+    ]
+    dates = ensure_chronology_bulk(created_dates, due_dates, completed_dates)
+
+    assignee_ids = random_user_ids(users, total)
+
+    task_ids = generate_uuid_batch("task", total)
+
+    # Render a fixed pool of names once and index into it per task
+    name_pool = [_generate_task_name(prompts) for _ in range(_NAME_POOL_SIZE)]
+    name_idx = np.random.randint(0, _NAME_POOL_SIZE, size=total).tolist()
+
+    idx = 0
+
     # ✅ tqdm added to project loop
-    for project in tqdm(projects, desc="Generating tasks (projects)"):
+    for project, num_tasks in tqdm(
+        zip(projects, counts),
+        total=len(projects),
+        desc="Generating tasks (projects)",
+    ):
         project_id = project["project_id"]
         project_name = project.get("name", "Unnamed Project")
 
-        num_tasks = random.randint(
-            max(20, base_tasks_per_project // 2),
-            min(150, base_tasks_per_project * 2),
-        )
-
-        # ✅ tqdm added to task loop
-        for _ in tqdm(
-            range(num_tasks),
-            desc=f"Tasks for {project_id}",
-            leave=False,
-        ):
-            if len(tasks) >= total_task_limit:
-                print("[✅] Task generation reached total_task_limit.")
-                return tasks
-
-            task_name = _generate_task_name(prompts)
-            status = weighted_choice(_STATUS_WEIGHTS)
-            priority = weighted_choice(_PRIORITY_WEIGHTS)
-
-            created_at = random_date("2021-01-01", "2025-01-01")
-            due_date = random_date(created_at, "2025-12-31")
-
-            completed_at: Optional[str] = None
-            completed = status == "Done"
-
-            if completed:
-                completed_at = random_date(due_date, "2025-12-31")
-
-            dates = ensure_chronology(
-                created_at=created_at,
-                due_date=due_date,
-                completed_at=completed_at,
-            )
-
-            assignee_id: Optional[str] = None
-            if users and random_bool(0.8):
-                assignee_id = random.choice(users)["user_id"]
-
+        for _ in range(num_tasks):
             tasks.append(
                 {
-                    "task_id": generate_uuid("task"),
+                    "task_id": task_ids[idx],
                     "project_id": project_id,
-                    "assignee_id": assignee_id,
-                    "name": task_name,
-                    "description": _generate_description(project_name, task_name),
-                    "priority": priority,
-                    "status": status,
-                    "completed": completed,
-                    "created_at": dates["created_at"],
-                    "due_date": dates["due_date"],
-                    "completed_at": dates["completed_at"],
+                    "assignee_id": assignee_ids[idx],
+                    "name": name_pool[name_idx[idx]],
+                    "description": None,
+                    "priority": priorities[idx],
+                    "status": statuses[idx],
+                    "completed": completed_flags[idx],
+                    "created_at": dates["created_at"][idx],
+                    "due_date": dates["due_date"][idx],
+                    "completed_at": dates["completed_at"][idx],
                 }
             )
-
-    print(f"[✅] Generated {len(tasks):,} tasks successfully.")
+            project_names.append(project_name)
+            idx += 1
+
+    descriptions: List[Optional[str]] = [None] * len(tasks)
+    if LLM_ENABLED:
+        description_prompts = [
+            _description_prompt(project_name, task["name"])
+            for project_name, task in zip(project_names, tasks)
+        ]
+        descriptions = generate_text_batch(description_prompts, cache=True)
+    for task, description in zip(tasks, descriptions):
+        task["description"] = description or _fallback_description(task["name"])
+
+    logger.info("[✅] Generated %s tasks successfully.", f"{len(tasks):,}")
     return tasks
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     fake_projects = [
         {"project_id": f"proj_{i}", "team_id": "team_1", "name": "Demo Project"}
@@ -7,6 +7,7 @@ within a single organization.
 
 from __future__ import annotations
 
+import logging
 import random
 from typing import List, Dict
 
@@ -17,6 +18,9 @@ from utils.date_utils import random_date
 from utils.random_utils import generate_uuid
 
 
+logger = logging.getLogger(__name__)
+
+
 _DEPARTMENT_DESCRIPTIONS = {
     "Engineering": "Responsible for building, maintaining, and scaling core product features.",
     "Design": "Handles product design, UX research, and visual branding.",
@@ -48,8 +52,6 @@ def generate_teams(
     if num_teams <= 0:
         raise ValueError("num_teams must be a positive integer")
 
-    random.seed(42)
-
     departments = get_departments()
     if not departments:
         raise ValueError("No departments available for team generation")
@@ -84,12 +86,14 @@ def generate_teams(
             }
         )
 
-    print(f"[✅] Generated {len(teams):,} teams successfully.")
+    logger.info("[✅] Generated %s teams successfully.", f"{len(teams):,}")
     return teams
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     generated_teams = generate_teams(
         org_id="org_001",
@@ -7,44 +7,49 @@ join dates, and activity status.
 
 from __future__ import annotations
 
+import logging
 import random
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
-from tqdm import tqdm  # ✅ ADDED
-
-from scrapers.names_scraper import generate_user_profile
+from scrapers.names_scraper import generate_profile_shard
 from scrapers.company_scraper import get_departments
-from utils.date_utils import random_date
-from utils.random_utils import generate_uuid, random_bool
+from utils.date_utils import random_dates
+from utils.parallel_utils import parallel_map
+from utils.random_utils import generate_uuid_batch, random_bool
+
 
-seen_emails = set()
+logger = logging.getLogger(__name__)
 
 
 def generate_users(
     teams: List[Dict],
     total_users: int = 8000,
     company: str = "DataWhale",
+    workers: int = 1,
 ) -> List[Dict]:
     """
     Generate realistic users distributed across teams.
+
+    Profiles are generated one team per shard with per-shard seeds, so the
+    output is identical for any number of worker processes.
     """
     if not teams:
         raise ValueError("Teams list cannot be empty")
 
-    random.seed(42)
-
     users: List[Dict] = []
-    seen_emails: set[str] = set()
+    # (local part, domain) -> number of users already given that address
+    email_counts: Dict[Tuple[str, str], int] = {}
 
     num_teams = len(teams)
 
     base_users_per_team = total_users // num_teams
     remainder = total_users % num_teams
 
-    # ✅ tqdm added to team loop
-    for idx, team in enumerate(tqdm(teams, desc="Generating users (teams)")):
-        team_id = team["team_id"]
-        department = team.get("department") or random.choice(get_departments())
+    # First pass: pick each team's department and size from the global RNG
+    departments: List[str] = []
+    team_sizes: List[int] = []
+    for idx, team in enumerate(teams):
+        departments.append(team.get("department") or random.choice(get_departments()))
 
         team_size = base_users_per_team
         if idx < remainder:
@@ -52,57 +57,63 @@ def generate_users(
 
         # Add 10–20% variation in team size
         variation = int(team_size * random.uniform(-0.1, 0.2))
-        team_size = max(1, team_size + variation)
-
-        # ✅ tqdm added to per-team user loop
-        for _ in tqdm(
-            range(team_size),
-            desc=f"Users for {team_id}",
-            leave=False,
-        ):
-            profile = generate_user_profile(
-                company=company,
-                department=department,
-            )
+        team_sizes.append(max(1, team_size + variation))
+
+    # One profile shard per team, each with its own seed, generated across
+    # worker processes
+    base_seed = random.getrandbits(32)
+    shards = [
+        (company, department, team_size, base_seed + shard_id)
+        for shard_id, (department, team_size) in enumerate(
+            zip(departments, team_sizes)
+        )
+    ]
+    team_profiles = parallel_map(
+        generate_profile_shard,
+        shards,
+        workers=workers,
+        desc="Generating users (teams)",
+    )
+
+    for team, team_size, profiles in zip(teams, team_sizes, team_profiles):
+        team_id = team["team_id"]
+        joined_dates = random_dates("2021-01-01", "2025-12-31", size=team_size)
+        user_ids = generate_uuid_batch("user", team_size)
 
+        for profile, joined_at, user_id in zip(profiles, joined_dates, user_ids):
             email = profile["email"]
 
-            # Ensure email uniqueness safely
+            # Ensure email uniqueness: repeats get +2, +3, ... in O(1)
             base_local, domain = email.split("@", 1)
-            counter = 1
-            unique_email = email
-
-            while unique_email in seen_emails:
-                counter += 1
-                unique_email = f"{base_local}+{counter}@{domain}"
-
-            email = unique_email
-            seen_emails.add(email)
+            key = (base_local, domain)
+            seen = email_counts.get(key, 0)
+            if seen:
+                email = f"{base_local}+{seen + 1}@{domain}"
+            email_counts[key] = seen + 1
 
             users.append(
                 {
-                    "user_id": generate_uuid("user"),
+                    "user_id": user_id,
                     "team_id": team_id,
                     "name": profile["name"],
                     "email": email,
                     "role": profile["role"],
                     "is_active": random_bool(0.9),
-                    "joined_at": random_date(
-                        "2021-01-01",
-                        "2025-12-31",
-                    ),
+                    "joined_at": joined_at,
                 }
             )
 
     random.shuffle(users)
     users = users[:total_users]
 
-    print(f"[✅] Generated {len(users):,} users successfully.")
+    logger.info("[✅] Generated %s users successfully.", f"{len(users):,}")
     return users
 
 
 if __name__ == "__main__":
-    random.seed(42)
+    from utils.random_utils import seed_all
+
+    seed_all(42)
 
     fake_teams = [
         {"team_id": f"team_{i}", "department": dep}
@@ -6,11 +6,15 @@ Runs the full data generation pipeline and persists results into SQLite.
 
 from __future__ import annotations
 
+import logging
 import os
 import sqlite3
+from dataclasses import fields, is_dataclass
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple, Union
 
 from generators.organization import generate_organization
 from generators.teams import generate_teams
@@ -18,11 +22,17 @@ from generators.users import generate_users
 from generators.projects import generate_projects
 from generators.sections import generate_sections
 from generators.tasks import generate_tasks
-from generators.subtasks import generate_subtasks
-from generators.comments import generate_comments
-from generators.tags import generate_tags, assign_tags_to_tasks
-from generators.attachments import generate_attachments
+from generators.subtasks import iter_subtasks
+from generators.comments import iter_comments
+from generators.tags import generate_tags, iter_task_tags
+from generators.attachments import iter_attachments
 from generators.custom_fields import generate_custom_fields
+from utils.random_utils import seed_all
+from utils.parallel_utils import prefetch
+from models import BaseModel, Table
+
+
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------
@@ -31,9 +41,15 @@ from generators.custom_fields import generate_custom_fields
 
 COMPANY_NAME = os.getenv("COMPANY_NAME", "DataWhale Technologies")
 TOTAL_TASKS = int(os.getenv("TOTAL_TASKS", "20000"))
+SEED = int(os.getenv("SEED", "42"))
+WORKERS = int(os.getenv("WORKERS", "1"))
+QUIET = os.getenv("QUIET", "0") == "1"
 DB_PATH = Path(os.getenv("DB_PATH", "output/asana_simulation.sqlite"))
 SCHEMA_PATH = Path("schema.sql")
 
+# Rows handed to each executemany call
+_INSERT_CHUNK_SIZE = 5000
+
 
 # ---------------------------------------------------------------------
 # Database helpers
@@ -52,48 +68,102 @@ def setup_database(schema_file: str | Path = SCHEMA_PATH) -> sqlite3.Connection:
     """
     os.makedirs(DB_PATH.parent, exist_ok=True)
 
-    if DB_PATH.exists():
-        DB_PATH.unlink()
+    for path in (DB_PATH, Path(f"{DB_PATH}-wal"), Path(f"{DB_PATH}-shm")):
+        path.unlink(missing_ok=True)
 
     conn = sqlite3.connect(DB_PATH)
     conn.execute("PRAGMA foreign_keys = ON;")
+    # Page size only takes effect before the first table is created
+    conn.execute("PRAGMA page_size = 8192;")
 
     with open(schema_file, "r", encoding="utf-8") as f:
         conn.executescript(f.read())
 
     conn.commit()
-    print("🗄️  Database initialized")
+
+    # Bulk-load settings: the database is rebuilt from scratch each run,
+    # so durability on crash is not needed
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = OFF;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -200000;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
+
+    logger.info("🗄️  Database initialized")
     return conn
 
 
+def _row_getter(
+    getter: Callable[..., Callable[[Any], Any]], columns: Sequence[str]
+) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Build a C-level row -> tuple accessor from attrgetter or itemgetter.
+
+    A getter over a single name returns a bare value, so that case is
+    wrapped to keep every row a tuple.
+    """
+    get = getter(*columns)
+    if len(columns) == 1:
+        return lambda row: (get(row),)
+    return get
+
+
 def insert_data(
     conn: sqlite3.Connection,
     table_name: str,
-    records: List[Dict],
+    records: Union[Table, Iterable[Union[Dict, BaseModel, Table]]],
 ) -> None:
     """
     Bulk insert records into a SQLite table.
 
+    Records are streamed into executemany in chunks of
+    ``_INSERT_CHUNK_SIZE`` rows, so generators can be passed directly
+    without materializing every row first. The next chunk is generated on
+    a background thread while SQLite writes the current one. The caller
+    commits; all tables are loaded in one transaction.
+
     Args:
         conn: SQLite connection.
         table_name: Target table name.
-        records: List of dictionaries representing rows.
+        records: A column-oriented Table, or an iterable of row dictionaries,
+            BaseModel records or Table chunks.
     """
-    if not records:
-        print(f"⚠️  Skipped {table_name} (no records)")
+    if isinstance(records, Table):
+        records = [records]
+
+    rows = iter(records)
+    first = next(rows, None)
+    if first is None:
+        logger.info("⚠️  Skipped %s (no records)", table_name)
         return
+    rows = chain([first], rows)
+
+    if isinstance(first, Table):
+        columns = first.columns
+        values = chain.from_iterable(table.itertuples() for table in rows)
+    elif is_dataclass(first):
+        columns = [field.name for field in fields(first)]
+        values = map(_row_getter(attrgetter, columns), rows)
+    else:
+        columns = list(first.keys())
+        values = map(_row_getter(itemgetter, columns), rows)
 
-    columns = records[0].keys()
     placeholders = ", ".join("?" for _ in columns)
     column_clause = ", ".join(columns)
 
     sql = f"INSERT INTO {table_name} ({column_clause}) VALUES ({placeholders})"
-    values = [tuple(record[col] for col in columns) for record in records]
 
-    conn.executemany(sql, values)
-    conn.commit()
+    chunks = iter(lambda: list(islice(values, _INSERT_CHUNK_SIZE)), [])
 
-    print(f"✅ Inserted {len(records):,} rows into {table_name}")
+    inserted = 0
+    for chunk in prefetch(chunks):
+        inserted += conn.executemany(sql, chunk).rowcount
+
+    if not inserted:
+        logger.info("⚠️  Skipped %s (no records)", table_name)
+        return
+
+    logger.info("✅ Inserted %s rows into %s", f"{inserted:,}", table_name)
 
 
 # ---------------------------------------------------------------------
@@ -103,50 +173,49 @@ def insert_data(
 
 def main() -> None:
     start_time = datetime.now()
-    print("🚀 Starting Asana Simulation Data Generation\n")
+    logger.info("🚀 Starting Asana Simulation Data Generation")
 
     try:
         conn = setup_database()
+        seed_all(SEED)
 
         # --------------------------------------------------------------
         # Generate data
         # --------------------------------------------------------------
 
         org = generate_organization(COMPANY_NAME)
-        print("[✅] Organization generated successfully.")
+        logger.info("[✅] Organization generated successfully.")
 
         teams = generate_teams(org_id=org["org_id"])
-        print("[✅] Teams generated successfully.")
+        logger.info("[✅] Teams generated successfully.")
 
-        users = generate_users(teams)
-        print("[✅] Users generated successfully.")
+        users = generate_users(teams, workers=WORKERS)
+        logger.info("[✅] Users generated successfully.")
 
         projects = generate_projects(teams)
-        print("[✅] Projects generated successfully.")
+        logger.info("[✅] Projects generated successfully.")
 
         sections = generate_sections(projects)
-        print("[✅] Sections generated successfully.")
+        logger.info("[✅] Sections generated successfully.")
 
         tasks = generate_tasks(projects, users, TOTAL_TASKS)
-        print("[✅] Tasks generated successfully.")
-
-        subtasks = generate_subtasks(tasks, users)
-        print("[✅] Subtasks generated successfully.")
+        logger.info("[✅] Tasks generated successfully.")
 
-        comments = generate_comments(tasks, users)
-        print("[✅] Comments generated successfully.")
+        # Tasks stay materialized because every later generator reads them.
+        # Subtasks, comments, task-tags and attachments are leaves, so they
+        # are streamed: their rows are generated while being inserted below
+        subtasks = iter_subtasks(tasks, users, workers=WORKERS)
+        comments = iter_comments(tasks, users)
 
         tags = generate_tags(40)
-        print("[✅] Tags generated successfully.")
+        logger.info("[✅] Tags generated successfully.")
 
-        task_tags = assign_tags_to_tasks(tasks, tags)
-        print("[✅] Task–tag mappings generated successfully.")
+        task_tags = iter_task_tags(tasks, tags)
 
-        attachments = generate_attachments(tasks)
-        print("[✅] Attachments generated successfully.")
+        attachments = iter_attachments(tasks)
 
         custom_fields = generate_custom_fields(projects)
-        print("[✅] Custom fields generated successfully.")
+        logger.info("[✅] Custom fields generated successfully.")
 
         # --------------------------------------------------------------
         # Insert data (FK-safe order)
@@ -165,6 +234,7 @@ def main() -> None:
         insert_data(conn, "attachments", attachments)
         insert_data(conn, "custom_fields", custom_fields)
 
+        conn.commit()
         conn.close()
 
         # --------------------------------------------------------------
@@ -172,15 +242,19 @@ def main() -> None:
         # --------------------------------------------------------------
 
         duration = datetime.now() - start_time
-        print("\n🎉 Simulation complete!")
-        print(f"📦 Database ready at: {DB_PATH}")
-        print(f"⏱️  Time taken: {duration}")
+        logger.info("🎉 Simulation complete!")
+        logger.info("📦 Database ready at: %s", DB_PATH)
+        logger.info("⏱️  Time taken: %s", duration)
 
     except Exception as exc:
-        print("❌ Simulation failed")
-        print(str(exc))
+        logger.error("❌ Simulation failed")
+        logger.error(str(exc))
         raise
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.WARNING if QUIET else logging.INFO,
+        format="%(asctime)s %(message)s",
+    )
     main()
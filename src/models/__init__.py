@@ -2,11 +2,28 @@
 Base model utilities for Asana simulation entities.
 
 Provides lightweight dataclass helpers to standardize
-dictionary conversion and instance creation across generators.
+dictionary conversion and instance creation across generators,
+slotted row records for high-volume leaf entities, and a
+column-oriented Table container for bulk generator output.
 """
 
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, Type, TypeVar
+from __future__ import annotations
+
+from dataclasses import dataclass, asdict, fields
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import numpy as np
 
 
 T = TypeVar("T", bound="BaseModel")
@@ -18,6 +35,9 @@ class BaseModel:
     Common parent class for all generated data entities.
     """
 
+    # Empty slots let slotted subclasses drop the per-instance __dict__
+    __slots__ = ()
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert dataclass instance to a dictionary.
@@ -31,10 +51,15 @@ class BaseModel:
         """
         Return a readable string representation.
 
+        Field values are read directly rather than through ``asdict``, which
+        would deep-copy every field just to print it.
+
         Returns:
             String representation with field values.
         """
-        attrs = ", ".join(f"{key}={value!r}" for key, value in asdict(self).items())
+        attrs = ", ".join(
+            f"{field.name}={getattr(self, field.name)!r}" for field in fields(self)
+        )
         return f"<{self.__class__.__name__}({attrs})>"
 
 
@@ -58,7 +83,193 @@ class FactoryMixin:
         return obj
 
 
-__all__ = ["BaseModel", "FactoryMixin"]
+@dataclass(repr=False)
+class Section(BaseModel):
+    """Workflow section (board column) of a project."""
+
+    # Hand-written slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = (
+        "section_id",
+        "project_id",
+        "name",
+        "position",
+        "created_at",
+    )
+
+    section_id: str
+    project_id: str
+    name: str
+    position: int
+    created_at: Optional[str]
+
+
+@dataclass(repr=False)
+class Subtask(BaseModel):
+    """Subtask belonging to a parent task."""
+
+    __slots__ = (
+        "subtask_id",
+        "parent_task_id",
+        "assignee_id",
+        "name",
+        "description",
+        "status",
+        "completed",
+        "created_at",
+        "due_date",
+        "completed_at",
+    )
+
+    subtask_id: str
+    parent_task_id: str
+    assignee_id: Optional[str]
+    name: str
+    description: Optional[str]
+    status: str
+    completed: bool
+    created_at: str
+    due_date: str
+    completed_at: Optional[str]
+
+
+@dataclass(repr=False)
+class Comment(BaseModel):
+    """User comment on a task."""
+
+    __slots__ = (
+        "comment_id",
+        "task_id",
+        "user_id",
+        "text",
+        "created_at",
+        "is_edited",
+    )
+
+    comment_id: str
+    task_id: str
+    user_id: str
+    text: Optional[str]
+    created_at: str
+    is_edited: bool
+
+
+@dataclass(repr=False)
+class CustomField(BaseModel):
+    """Project-level custom field definition."""
+
+    __slots__ = (
+        "custom_field_id",
+        "project_id",
+        "name",
+        "type",
+        "possible_values",
+    )
+
+    custom_field_id: str
+    project_id: str
+    name: str
+    type: str
+    possible_values: Optional[str]
+
+
+class Table:
+    """
+    Column-oriented (SoA) container of generated rows.
+
+    Stores one sequence (list or NumPy array) per column instead of one
+    dictionary per row, which avoids per-row dict overhead for large tables.
+    """
+
+    def __init__(self, data: Dict[str, Sequence[Any]]) -> None:
+        """
+        Create a table from equal-length columns.
+
+        Args:
+            data: Mapping of column name -> column values, in column order.
+        """
+        lengths = {len(values) for values in data.values()}
+        if len(lengths) > 1:
+            raise ValueError("All table columns must have the same length")
+        self.data = data
+
+    @classmethod
+    def empty(cls, columns: Sequence[str]) -> Table:
+        """
+        Create a table with the given columns and no rows.
+
+        Args:
+            columns: Column names, in column order.
+
+        Returns:
+            Table with zero rows.
+        """
+        return cls({column: [] for column in columns})
+
+    @classmethod
+    def concat(cls, tables: Iterable[Table], columns: Sequence[str]) -> Table:
+        """
+        Stack several tables with the given columns into one.
+
+        Args:
+            tables: Tables to combine, in row order.
+            columns: Column names of the result.
+
+        Returns:
+            Combined table.
+        """
+        data: Dict[str, List[Any]] = {column: [] for column in columns}
+        for table in tables:
+            for column in columns:
+                values = table.data[column]
+                data[column].extend(
+                    values.tolist() if isinstance(values, np.ndarray) else values
+                )
+        return cls(data)
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names in insertion order."""
+        return list(self.data)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.data.values()), ()))
+
+    def __getitem__(self, column: str) -> Sequence[Any]:
+        return self.data[column]
+
+    def itertuples(self) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate rows as tuples of native Python values.
+
+        Returns:
+            Iterator of row tuples in column order.
+        """
+        columns = [
+            values.tolist() if isinstance(values, np.ndarray) else values
+            for values in self.data.values()
+        ]
+        return zip(*columns)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Convert the table into a list of row dictionaries.
+
+        Returns:
+            List of dictionaries, one per row.
+        """
+        columns = self.columns
+        return [dict(zip(columns, row)) for row in self.itertuples()]
+
+
+__all__ = [
+    "BaseModel",
+    "FactoryMixin",
+    "Section",
+    "Subtask",
+    "Comment",
+    "CustomField",
+    "Table",
+]
 
 
 if __name__ == "__main__":
@@ -75,3 +286,6 @@ if __name__ == "__main__":
     print("[✅] BaseModel and FactoryMixin working correctly.")
     print(obj)
     print(obj.to_dict())
+
+    table = Table({"id": ["demo_1", "demo_2"], "name": ["Test Entity", "Other Entity"]})
+    print(table.to_records())
@@ -7,17 +7,37 @@ live scraping from Y Combinator (disabled by default).
 
 from __future__ import annotations
 
+import logging
 import random
-from typing import List, Dict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm  # ✅ ADDED
+from urllib3.util.retry import Retry
 
 try:
     from bs4 import BeautifulSoup
 except ImportError:  # BeautifulSoup is optional
     BeautifulSoup = None
 
+try:
+    import requests_cache
+except ImportError:  # requests-cache is optional
+    requests_cache = None
+
+try:
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = "lxml"
+except ImportError:  # lxml is optional; fall back to the stdlib parser
+    _HTML_PARSER = "html.parser"
+
+
+logger = logging.getLogger(__name__)
+
 
 # ---------------------------------------------------------------------
 # Static fallback data (always available, research-inspired)
@@ -77,32 +97,71 @@ _DEPARTMENTS: List[str] = [
 # Scraping utilities
 # ---------------------------------------------------------------------
 
+_HTTP_CACHE_PATH = Path("output/http_cache")
+_HTTP_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """
+    Return the shared HTTP session used for scraping.
+
+    Transient failures are retried with backoff. When requests-cache is
+    installed, responses are also cached on disk for a day, so repeated
+    runs do not re-download pages.
+
+    Returns:
+        Configured requests session.
+    """
+    if requests_cache is not None:
+        _HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            str(_HTTP_CACHE_PATH), expire_after=_HTTP_CACHE_TTL_SECONDS
+        )
+    else:
+        session = requests.Session()
+
+    adapter = HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
-def scrape_yc_companies(limit: int = 50) -> List[str]:
+@lru_cache(maxsize=8)
+def scrape_yc_companies(limit: int = 50) -> Tuple[str, ...]:
     """
     Attempt to scrape company names from Y Combinator's company directory.
 
+    Results are memoized per ``limit`` for the life of the process, so
+    repeated calls (including failed attempts) do not hit the network again.
+
     Args:
         limit: Maximum number of company names to return.
 
     Returns:
-        List of company names; empty list on failure.
+        Tuple of company names; empty tuple on failure.
     """
     if BeautifulSoup is None:
-        print("[WARN] BeautifulSoup not available, skipping live scrape.")
-        return []
+        logger.warning("[WARN] BeautifulSoup not available, skipping live scrape.")
+        return ()
 
     url = "https://www.ycombinator.com/companies"
     headers = {"User-Agent": "Mozilla/5.0"}
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _get_session().get(url, headers=headers, timeout=10)
         response.raise_for_status()
     except requests.RequestException as exc:
-        print(f"[WARN] YC scrape failed: {exc}")
-        return []
+        logger.warning("[WARN] YC scrape failed: %s", exc)
+        return ()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.text, _HTML_PARSER)
 
     names: List[str] = []
 
@@ -117,8 +176,8 @@ def scrape_yc_companies(limit: int = 50) -> List[str]:
         if len(names) >= limit:
             break
 
-    print(f"[✅] Scraped {len(names)} companies from YC.")
-    return names
+    logger.info("[✅] Scraped %d companies from YC.", len(names))
+    return tuple(names)
 
 
 # ---------------------------------------------------------------------
@@ -140,37 +199,45 @@ def get_company_names(limit: int = 10, live: bool = False) -> List[str]:
     if live:
         scraped = scrape_yc_companies(limit=limit)
         if scraped:
-            print("[✅] Company names fetched via live scrape.")
-            return scraped[:limit]
+            logger.info("[✅] Company names fetched via live scrape.")
+            return list(scraped[:limit])
 
     names = random.sample(
         _FALLBACK_COMPANIES,
         k=min(limit, len(_FALLBACK_COMPANIES)),
     )
-    print("[✅] Company names generated from fallback list.")
+    logger.info("[✅] Company names generated from fallback list.")
     return names
 
 
-def get_industries() -> List[str]:
+@lru_cache(maxsize=1)
+def get_industries() -> Tuple[str, ...]:
     """
     Return supported SaaS industry categories.
 
+    The result is memoized; callers that need to mutate it should copy it
+    with ``list(...)``.
+
     Returns:
-        List of industries.
+        Tuple of industries.
     """
-    print("[✅] Industries loaded.")
-    return list(_INDUSTRIES)
+    logger.debug("[✅] Industries loaded.")
+    return tuple(_INDUSTRIES)
 
 
-def get_departments() -> List[str]:
+@lru_cache(maxsize=1)
+def get_departments() -> Tuple[str, ...]:
     """
     Return realistic company departments.
 
+    The result is memoized; callers that need to mutate it should copy it
+    with ``list(...)``.
+
     Returns:
-        List of department names.
+        Tuple of department names.
     """
-    print("[✅] Departments loaded.")
-    return list(_DEPARTMENTS)
+    logger.debug("[✅] Departments loaded.")
+    return tuple(_DEPARTMENTS)
 
 
 def get_company_profile() -> Dict[str, str]:
@@ -185,7 +252,7 @@ def get_company_profile() -> Dict[str, str]:
         "industry": random.choice(_INDUSTRIES),
         "department": random.choice(_DEPARTMENTS),
     }
-    print("[✅] Company profile generated.")
+    logger.info("[✅] Company profile generated.")
     return profile
 
 
@@ -9,11 +9,16 @@ from __future__ import annotations
 
 import random
 import re
-from typing import Dict, List, Optional
+import string
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from faker import Faker
 from tqdm import tqdm  # ✅ ADDED (non-intrusive)
 
+from utils.parallel_utils import parallel_map
+
 
 # ---------------------------------------------------------------------
 # Static fallback data
@@ -72,14 +77,53 @@ _ROLE_MAP: Dict[str, List[str]] = {
     ],
 }
 
+_ALL_ROLES: Tuple[str, ...] = tuple(
+    role for roles in _ROLE_MAP.values() for role in roles
+)
+
 _DOMAINS: List[str] = [".com", ".io", ".co", ".ai", ".tech"]
 
+_NON_ASCII = re.compile(r"[^\x00-\x7F]+")
+
+# ASCII bytes to delete when cleaning names and company names for emails;
+# non-ASCII characters are dropped by the encode step before translate
+_NAME_DELETE = bytes(
+    b for b in range(128) if chr(b) not in string.ascii_letters + " "
+)
+_COMPANY_DELETE = bytes(b for b in range(128) if chr(b) not in string.ascii_letters)
+
+_GENDERS = ("male", "female", None)
+
+# Profiles per shard in generate_user_profiles_parallel
+_PROFILE_SHARD_SIZE = 1000
+
+# One Faker per locale: building one loads every provider for the locale
+_FAKER_CACHE: Dict[str, Faker] = {}
+
 
 # ---------------------------------------------------------------------
 # Core helpers
 # ---------------------------------------------------------------------
 
 
+def _faker_for(locale: str) -> Faker:
+    """Return the shared Faker for a locale, building it on first use."""
+    return _FAKER_CACHE.get(locale) or _FAKER_CACHE.setdefault(locale, Faker(locale))
+
+
+def _fake_name(faker: Faker, gender: Optional[str] = None) -> str:
+    """Draw an ASCII-only full name from a specific Faker instance."""
+    if gender == "male":
+        name = faker.name_male()
+    elif gender == "female":
+        name = faker.name_female()
+    else:
+        name = faker.name()
+
+    name = _NON_ASCII.sub("", name)
+    return name.strip()
+
+
 def get_fake_name(locale: str = "en_US", gender: Optional[str] = None) -> str:
     """
     Generate a realistic full name using Faker.
@@ -91,17 +135,32 @@ def get_fake_name(locale: str = "en_US", gender: Optional[str] = None) -> str:
     Returns:
         ASCII-only full name.
     """
-    faker = Faker(locale)
+    return _fake_name(_faker_for(locale), gender)
 
-    if gender == "male":
-        name = faker.name_male()
-    elif gender == "female":
-        name = faker.name_female()
-    else:
-        name = faker.name()
 
-    name = re.sub(r"[^\x00-\x7F]+", "", name)
-    return name.strip()
+def _email_local_part(name: str) -> str:
+    """Build the 'first.last' part of an email from a full name."""
+    parts = (
+        name.encode("ascii", "ignore")
+        .translate(None, _NAME_DELETE)
+        .lower()
+        .decode()
+        .split()
+    )
+
+    if len(parts) >= 2:
+        return f"{parts[0]}.{parts[-1]}"
+    return parts[0]
+
+
+def _email_domain(company: str) -> str:
+    """Build the lowercase letters-only email domain for a company."""
+    return (
+        company.encode("ascii", "ignore")
+        .translate(None, _COMPANY_DELETE)
+        .lower()
+        .decode()
+    )
 
 
 def get_email_from_name(name: str, company: str) -> str:
@@ -115,18 +174,18 @@ def get_email_from_name(name: str, company: str) -> str:
     Returns:
         Lowercase ASCII email address.
     """
-    clean_name = re.sub(r"[^a-zA-Z ]", "", name).lower().strip()
-    parts = clean_name.split()
+    tld = random.choice(_DOMAINS)
 
-    if len(parts) >= 2:
-        local = f"{parts[0]}.{parts[-1]}"
-    else:
-        local = parts[0]
+    return f"{_email_local_part(name)}@{_email_domain(company)}{tld}"
 
-    domain = re.sub(r"[^a-zA-Z]", "", company).lower()
-    tld = random.choice(_DOMAINS)
 
-    return f"{local}@{domain}{tld}"
+@lru_cache(maxsize=None)
+def _roles_tuple(department: Optional[str] = None) -> Tuple[str, ...]:
+    """Memoized, immutable roles for a department (all roles if unknown)."""
+    if department and department in _ROLE_MAP:
+        return tuple(_ROLE_MAP[department])
+
+    return _ALL_ROLES
 
 
 def get_roles(department: Optional[str] = None) -> List[str]:
@@ -139,14 +198,7 @@ def get_roles(department: Optional[str] = None) -> List[str]:
     Returns:
         List of roles.
     """
-    if department and department in _ROLE_MAP:
-        return list(_ROLE_MAP[department])
-
-    roles: List[str] = []
-    for values in _ROLE_MAP.values():
-        roles.extend(values)
-
-    return roles
+    return list(_roles_tuple(department))
 
 
 def get_random_role(department: Optional[str] = None) -> str:
@@ -159,7 +211,7 @@ def get_random_role(department: Optional[str] = None) -> str:
     Returns:
         Role string.
     """
-    return random.choice(get_roles(department))
+    return random.choice(_roles_tuple(department))
 
 
 def generate_user_profile(
@@ -186,6 +238,126 @@ def generate_user_profile(
     }
 
 
+def _build_profiles(
+    company: str,
+    roles: Tuple[str, ...],
+    gender_idx: List[int],
+    tld_idx: List[int],
+    role_idx: List[int],
+    faker: Faker,
+) -> List[Dict[str, str]]:
+    """Assemble profiles from pre-drawn indices, drawing names from faker."""
+    domain = _email_domain(company)
+
+    profiles: List[Dict[str, str]] = []
+    for g, t, r in zip(gender_idx, tld_idx, role_idx):
+        name = _fake_name(faker, _GENDERS[g])
+        profiles.append(
+            {
+                "name": name,
+                "email": f"{_email_local_part(name)}@{domain}{_DOMAINS[t]}",
+                "role": roles[r],
+            }
+        )
+
+    return profiles
+
+
+def generate_profile_shard(shard: Tuple) -> List[Dict[str, str]]:
+    """
+    Generate one shard of user profiles.
+
+    Runs in a worker process, so all randomness comes from the shard's own
+    seeded RNG and Faker instance rather than the global ones; the output
+    depends only on the shard tuple.
+
+    Args:
+        shard: (company, department, n, seed) tuple.
+
+    Returns:
+        List of dictionaries with name, email, and role.
+    """
+    company, department, n, seed = shard
+    rng = np.random.default_rng(seed)
+    roles = _roles_tuple(department)
+
+    gender_idx = rng.integers(0, len(_GENDERS), size=n).tolist()
+    tld_idx = rng.integers(0, len(_DOMAINS), size=n).tolist()
+    role_idx = rng.integers(0, len(roles), size=n).tolist()
+
+    # A private instance keeps the shard's names independent of other shards
+    faker = Faker("en_US")
+    faker.seed_instance(seed)
+
+    return _build_profiles(company, roles, gender_idx, tld_idx, role_idx, faker)
+
+
+def generate_user_profiles(
+    company: str,
+    department: Optional[str] = None,
+    n: int = 1,
+) -> List[Dict[str, str]]:
+    """
+    Generate many synthetic user profiles for one company and department.
+
+    Runs as a single shard seeded from the global RNG, so genders, TLDs and
+    roles are drawn in bulk and only name generation runs per profile.
+
+    Args:
+        company: Company name.
+        department: Optional department context.
+        n: Number of profiles to generate.
+
+    Returns:
+        List of dictionaries with name, email, and role.
+    """
+    return generate_profile_shard((company, department, n, random.getrandbits(32)))
+
+
+def generate_user_profiles_parallel(
+    company: str,
+    department: Optional[str] = None,
+    n: int = 1,
+    workers: int = 1,
+) -> List[Dict[str, str]]:
+    """
+    Generate many user profiles, sharded across worker processes.
+
+    Profiles are split into fixed-size shards with consecutive seeds drawn
+    from the global RNG, so the result is identical for any worker count.
+
+    Args:
+        company: Company name.
+        department: Optional department context.
+        n: Number of profiles to generate.
+        workers: Number of worker processes (1 = run serially).
+
+    Returns:
+        List of dictionaries with name, email, and role.
+    """
+    base_seed = random.getrandbits(32)
+    shards = [
+        (
+            company,
+            department,
+            min(_PROFILE_SHARD_SIZE, n - start),
+            base_seed + shard_id,
+        )
+        for shard_id, start in enumerate(range(0, n, _PROFILE_SHARD_SIZE))
+    ]
+
+    return [
+        profile
+        for shard_profiles in parallel_map(
+            generate_profile_shard,
+            shards,
+            workers=workers,
+            desc="Generating user profiles (shards)",
+        )
+        for profile in shard_profiles
+    ]
+
+
 def get_domains() -> List[str]:
     """
     Return supported email domain extensions.
@@ -5,22 +5,24 @@ in a simulated Asana workspace.
 All dates use ISO format: YYYY-MM-DD
 """
 
-from datetime import datetime, timedelta
+from datetime import date
 import random
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
 
 
 DATE_FMT = "%Y-%m-%d"
 
 
-def _to_date(date_str: str) -> datetime:
-    """Convert ISO date string to datetime."""
-    return datetime.strptime(date_str, DATE_FMT)
+def _to_ordinal(date_str: str) -> int:
+    """Convert ISO date string to a day ordinal (C-level parse, no strptime)."""
+    return date.fromisoformat(date_str).toordinal()
 
 
-def _to_str(date_obj: datetime) -> str:
-    """Convert datetime to ISO date string."""
-    return date_obj.strftime(DATE_FMT)
+def _to_str(ordinal: int) -> str:
+    """Convert a day ordinal to ISO date string."""
+    return date.fromordinal(ordinal).isoformat()
 
 
 def random_date(start: str, end: str, seed: Optional[int] = None) -> str:
@@ -30,24 +32,68 @@ def random_date(start: str, end: str, seed: Optional[int] = None) -> str:
     Args:
         start: Start date in YYYY-MM-DD format.
         end: End date in YYYY-MM-DD format.
-        seed: Optional seed for deterministic randomness.
+        seed: Optional seed for a private RNG; the global one is left untouched.
 
     Returns:
         Random ISO date string between start and end.
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed) if seed is not None else random
+
+    start_day = _to_ordinal(start)
+    end_day = _to_ordinal(end)
+
+    if start_day > end_day:
+        start_day, end_day = end_day, start_day
+
+    offset = rng.randint(0, end_day - start_day)
+
+    return _to_str(start_day + offset)
+
 
-    start_dt = _to_date(start)
-    end_dt = _to_date(end)
+def _to_days(dates: Union[str, Sequence[Optional[str]]]) -> np.ndarray:
+    """Parse ISO date string(s) into int64 days since epoch (NaT for None)."""
+    return np.atleast_1d(np.asarray(dates, dtype="datetime64[D]"))
 
-    if start_dt > end_dt:
-        start_dt, end_dt = end_dt, start_dt
 
-    delta_days = (end_dt - start_dt).days
-    offset = random.randint(0, delta_days)
+def _from_days(days: np.ndarray) -> List[Optional[str]]:
+    """Format datetime64 days back into ISO strings (None for NaT)."""
+    return [
+        None if text == "NaT" else text
+        for text in days.astype("datetime64[D]").astype(str).tolist()
+    ]
 
-    return _to_str(start_dt + timedelta(days=offset))
+
+def random_dates(
+    start: Union[str, Sequence[str]],
+    end: Union[str, Sequence[str]],
+    size: Optional[int] = None,
+) -> List[str]:
+    """
+    Generate many random dates at once, one per (start, end) pair (inclusive).
+
+    Vectorized counterpart of random_date: bounds may be single ISO strings
+    or sequences of them (broadcast against each other). Dates are parsed,
+    drawn and formatted as int64 day counts, without strptime/strftime.
+
+    Args:
+        start: Start date(s) in YYYY-MM-DD format.
+        end: End date(s) in YYYY-MM-DD format.
+        size: Number of dates to draw when both bounds are single strings.
+
+    Returns:
+        List of random ISO date strings.
+    """
+    start_days = _to_days(start).astype(np.int64)
+    end_days = _to_days(end).astype(np.int64)
+    if size is not None:
+        start_days = np.broadcast_to(start_days, size)
+        end_days = np.broadcast_to(end_days, size)
+
+    low = np.minimum(start_days, end_days)
+    high = np.maximum(start_days, end_days)
+    days = np.atleast_1d(np.random.randint(low, high + 1))
+
+    return _from_days(days)
 
 
 def add_random_offset(
@@ -63,7 +109,7 @@ def add_random_offset(
         base_date: Base date in YYYY-MM-DD format.
         days_min: Minimum days to add (inclusive).
         days_max: Maximum days to add (inclusive).
-        seed: Optional seed for deterministic randomness.
+        seed: Optional seed for a private RNG; the global one is left untouched.
 
     Returns:
         New ISO date string after offset.
@@ -71,13 +117,35 @@ def add_random_offset(
     if days_min < 0 or days_max < days_min:
         raise ValueError("Invalid day offset range")
 
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed) if seed is not None else random
+    offset_days = rng.randint(days_min, days_max)
+
+    return _to_str(_to_ordinal(base_date) + offset_days)
+
+
+def add_random_offsets(
+    base_dates: Sequence[Optional[str]],
+    days_min: int,
+    days_max: int,
+) -> List[Optional[str]]:
+    """
+    Vectorized counterpart of add_random_offset over a column of dates.
+
+    Args:
+        base_dates: Base dates in YYYY-MM-DD format (None stays None).
+        days_min: Minimum days to add (inclusive).
+        days_max: Maximum days to add (inclusive).
+
+    Returns:
+        List of ISO date strings after offset.
+    """
+    if days_min < 0 or days_max < days_min:
+        raise ValueError("Invalid day offset range")
 
-    base_dt = _to_date(base_date)
-    offset_days = random.randint(days_min, days_max)
+    base = _to_days(base_dates)
+    offsets = np.random.randint(days_min, days_max + 1, size=len(base))
 
-    return _to_str(base_dt + timedelta(days=offset_days))
+    return _from_days(base + offsets.astype("timedelta64[D]"))
 
 
 def ensure_chronology(
@@ -103,23 +171,63 @@ def ensure_chronology(
     Returns:
         Dictionary with corrected dates.
     """
-    created_dt = _to_date(created_at)
+    created_day = _to_ordinal(created_at)
+
+    due_day = _to_ordinal(due_date) if due_date else None
+    completed_day = _to_ordinal(completed_at) if completed_at else None
 
-    due_dt = _to_date(due_date) if due_date else None
-    completed_dt = _to_date(completed_at) if completed_at else None
+    if due_day and due_day < created_day:
+        due_day = created_day + random.randint(1, 7)
 
-    if due_dt and due_dt < created_dt:
-        due_dt = created_dt + timedelta(days=random.randint(1, 7))
+    if completed_day:
+        reference_day = due_day if due_day else created_day
+        if completed_day < reference_day:
+            completed_day = reference_day + random.randint(1, 7)
+
+    return {
+        "created_at": _to_str(created_day),
+        "due_date": _to_str(due_day) if due_day else None,
+        "completed_at": _to_str(completed_day) if completed_day else None,
+    }
 
-    if completed_dt:
-        reference_dt = due_dt if due_dt else created_dt
-        if completed_dt < reference_dt:
-            completed_dt = reference_dt + timedelta(days=random.randint(1, 7))
+
+def ensure_chronology_bulk(
+    created_at: Sequence[str],
+    due_date: Sequence[Optional[str]],
+    completed_at: Sequence[Optional[str]],
+) -> Dict[str, List[Optional[str]]]:
+    """
+    Vectorized counterpart of ensure_chronology over equal-length columns.
+
+    Applies the same rules and 1–7 day corrections to every row at once;
+    None entries are treated as missing dates.
+
+    Args:
+        created_at: Creation dates (YYYY-MM-DD).
+        due_date: Optional due dates.
+        completed_at: Optional completion dates.
+
+    Returns:
+        Dictionary of corrected date columns.
+    """
+    created = _to_days(created_at)
+    due = _to_days(due_date)
+    completed = _to_days(completed_at)
+
+    # NaT compares False, so missing dates are never "corrected"
+    due_shift = np.random.randint(1, 8, size=len(created)).astype("timedelta64[D]")
+    due = np.where(due < created, created + due_shift, due)
+
+    reference = np.where(np.isnat(due), created, due)
+    completed_shift = np.random.randint(1, 8, size=len(created)).astype(
+        "timedelta64[D]"
+    )
+    completed = np.where(completed < reference, reference + completed_shift, completed)
 
     return {
-        "created_at": _to_str(created_dt),
-        "due_date": _to_str(due_dt) if due_dt else None,
-        "completed_at": _to_str(completed_dt) if completed_dt else None,
+        "created_at": _from_days(created),
+        "due_date": _from_days(due),
+        "completed_at": _from_days(completed),
     }
 
 
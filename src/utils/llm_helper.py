@@ -7,31 +7,141 @@ Supports OpenAI API with safe fallbacks when unavailable.
 
 from __future__ import annotations
 
+import logging
 import os
+import json
+import asyncio
+import atexit
+import hashlib
+import multiprocessing
+import sqlite3
+import threading
 import time
 import random
-from typing import List, Dict
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, List, Dict, Optional, Tuple
 
 import openai
-from tqdm import tqdm  # ✅ ADDED
-
-from utils.random_utils import random_sentence
 from dotenv import load_dotenv
 
 
+logger = logging.getLogger(__name__)
+
+
 # Load environment variables
 load_dotenv()
 
-# Read key and set config
+# Read key and set config. LLM_ENABLED=0 forces the offline fallback path
+# even when a key is present (e.g. CI, offline runs).
 _OPENAI_KEY = os.getenv("OPENAI_API_KEY")
-LLM_ENABLED = bool(_OPENAI_KEY)
+LLM_ENABLED = bool(_OPENAI_KEY) and os.getenv("LLM_ENABLED", "1") == "1"
 _OPENAI_INITIALIZED = False
 
 if LLM_ENABLED:
     openai.api_key = _OPENAI_KEY
     _OPENAI_INITIALIZED = True
-else:
-    print("[⚠️ Warning] LLM disabled: Missing OPENAI_API_KEY in .env")
+elif multiprocessing.current_process().name == "MainProcess":
+    # Spawned worker processes re-import this module; warn in the parent only
+    logger.warning(
+        "[⚠️ Warning] LLM disabled: Missing OPENAI_API_KEY or LLM_ENABLED=0 in .env"
+    )
+
+
+# In-process LRU cache of request key -> response for deterministic prompt
+# pools, backed by a persistent SQLite cache so responses survive across runs.
+# Generators may run on a prefetch thread, so one lock guards both caches.
+_RESPONSE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_RESPONSE_CACHE_MAXSIZE = 4096
+_CACHE_LOCK = threading.RLock()
+
+_DISK_CACHE_PATH = Path(os.getenv("LLM_CACHE_PATH", "output/llm_cache.sqlite"))
+_DISK_CACHE: Optional[sqlite3.Connection] = None
+
+# Transient API errors worth retrying; APITimeoutError is a subclass of
+# APIConnectionError but is listed for clarity
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+)
+
+# "{name}" placeholders filled by generate_from_template
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+
+def _cache_key(prompt: str, model: str, temperature: float, max_tokens: int) -> str:
+    """Stable cache key for a request: the prompt plus its sampling settings."""
+    request = json.dumps([prompt, model, temperature, max_tokens])
+    return hashlib.blake2b(request.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _disk_cache() -> sqlite3.Connection:
+    """Open (and create if needed) the shared persistent response cache."""
+    global _DISK_CACHE
+
+    if _DISK_CACHE is None:
+        _DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Shared across threads; every use happens under _CACHE_LOCK
+        _DISK_CACHE = sqlite3.connect(_DISK_CACHE_PATH, check_same_thread=False)
+        _DISK_CACHE.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache "
+            "(prompt_hash TEXT PRIMARY KEY, response TEXT NOT NULL)"
+        )
+        _DISK_CACHE.commit()
+        atexit.register(_DISK_CACHE.close)
+    return _DISK_CACHE
+
+
+def _lru_put(key: str, response: str) -> None:
+    """Store a response in memory, evicting the least recently used entry."""
+    with _CACHE_LOCK:
+        _RESPONSE_CACHE[key] = response
+        _RESPONSE_CACHE.move_to_end(key)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
+
+def _cache_get(key: str) -> Optional[str]:
+    """Return a cached response for a request key (memory first, then disk)."""
+    with _CACHE_LOCK:
+        response = _RESPONSE_CACHE.get(key)
+        if response is not None:
+            _RESPONSE_CACHE.move_to_end(key)
+            return response
+
+        row = (
+            _disk_cache()
+            .execute("SELECT response FROM llm_cache WHERE prompt_hash = ?", (key,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        _lru_put(key, row[0])
+        return row[0]
+
+
+def _cache_put_many(items: Iterable[Tuple[str, str]]) -> None:
+    """Store request key -> response pairs in memory and on disk."""
+    items = list(items)
+
+    with _CACHE_LOCK:
+        for key, response in items:
+            _lru_put(key, response)
+
+        conn = _disk_cache()
+        conn.executemany(
+            "INSERT OR REPLACE INTO llm_cache (prompt_hash, response) VALUES (?, ?)",
+            items,
+        )
+        conn.commit()
+
+
+def _cache_put(key: str, response: str) -> None:
+    """Store a single request key -> response pair in memory and on disk."""
+    _cache_put_many([(key, response)])
 
 
 def random_sentence():
@@ -73,9 +183,10 @@ def generate_text(
     model: str = "gpt-3.5-turbo",
     temperature: float = 0.8,
     max_tokens: int = 80,
+    use_cache: Optional[bool] = None,
 ) -> str:
     """
-    Generate text using OpenAI ChatCompletion API.
+    Generate text using the OpenAI chat completions API.
 
     Falls back to synthetic text if API is disabled or fails.
 
@@ -84,6 +195,125 @@ def generate_text(
         model: OpenAI model name.
         temperature: Sampling temperature.
         max_tokens: Max tokens to generate.
+        use_cache: Reuse cached responses. Defaults to caching only when
+            temperature is 0, since sampled replies are meant to vary.
+
+    Returns:
+        Generated text string.
+    """
+    if use_cache is None:
+        use_cache = temperature == 0
+
+    if use_cache:
+        text = generate_text_cached(prompt, model, temperature, max_tokens)
+    else:
+        text = _complete_or_none(prompt, model, temperature, max_tokens)
+    return text or random_sentence()
+
+
+def _complete(
+    prompt: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Send a single chat completion request, raising on API errors."""
+    response = openai.chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+    return response.choices[0].message.content.strip()
+
+
+def _complete_or_none(
+    prompt: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> Optional[str]:
+    """Send a single chat completion request, returning None on any failure."""
+    if not LLM_ENABLED or not _OPENAI_INITIALIZED:
+        return None
+
+    try:
+        return _complete(prompt, model, temperature, max_tokens)
+    except Exception:
+        return None
+
+
+def generate_text_cached(
+    prompt: str,
+    model: str = "gpt-3.5-turbo",
+    temperature: float = 0.8,
+    max_tokens: int = 80,
+) -> Optional[str]:
+    """
+    Generate text for a prompt, reusing cached responses across calls and runs.
+
+    Responses are keyed by the prompt together with model, temperature and
+    max_tokens. Only successful API responses are cached; failures return
+    None so callers can apply their own fallback without poisoning the cache.
+
+    Args:
+        prompt: Input prompt.
+        model: OpenAI model name.
+        temperature: Sampling temperature.
+        max_tokens: Max tokens to generate.
+
+    Returns:
+        Generated (or cached) text, or None if the LLM is unavailable.
+    """
+    if not LLM_ENABLED or not _OPENAI_INITIALIZED:
+        return None
+
+    key = _cache_key(prompt, model, temperature, max_tokens)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    text = _complete_or_none(prompt, model, temperature, max_tokens)
+    if text is not None:
+        _cache_put(key, text)
+    return text
+
+
+async def _chat_completion_async(
+    client: openai.AsyncOpenAI,
+    prompt: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Send a single chat completion request, raising on API errors."""
+    response = await client.chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+    return response.choices[0].message.content.strip()
+
+
+async def generate_text_async(
+    prompt: str,
+    model: str = "gpt-3.5-turbo",
+    temperature: float = 0.8,
+    max_tokens: int = 80,
+    client: Optional[openai.AsyncOpenAI] = None,
+) -> str:
+    """
+    Async counterpart of generate_text for concurrent fan-out.
+
+    Falls back to synthetic text if API is disabled or fails.
+
+    Args:
+        prompt: Input prompt.
+        model: OpenAI model name.
+        temperature: Sampling temperature.
+        max_tokens: Max tokens to generate.
+        client: Optional shared async client (one is created if omitted).
 
     Returns:
         Generated text string.
@@ -92,38 +322,240 @@ def generate_text(
         return random_sentence()
 
     try:
-        response = openai.ChatCompletion.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=temperature,
-            max_tokens=max_tokens,
+        client = client or openai.AsyncOpenAI(api_key=openai.api_key)
+        return await _chat_completion_async(
+            client, prompt, model, temperature, max_tokens
         )
-        return response.choices[0].message["content"].strip()
     except Exception:
         return random_sentence()
 
 
+def _render_batch_prompt(prompts: List[str]) -> str:
+    """Combine several prompts into one numbered request."""
+    numbered = "\n".join(f"{idx}. {prompt}" for idx, prompt in enumerate(prompts, 1))
+    return (
+        f"Answer each of the following {len(prompts)} requests independently.\n\n"
+        f"{numbered}\n\n"
+        f"Respond with only a JSON array of {len(prompts)} strings, "
+        f"one answer per request, in the same order."
+    )
+
+
+def _parse_batch_response(content: str, expected: int) -> List[str]:
+    """
+    Parse a JSON array reply, validating it has one answer per prompt.
+
+    Only the outermost ``[...]`` span is parsed, so code fences or prose
+    around the array are ignored.
+    """
+    start, end = content.find("["), content.rfind("]")
+    if start == -1 or end < start:
+        raise ValueError("Reply contains no JSON array")
+
+    replies = json.loads(content[start : end + 1])
+    if not isinstance(replies, list) or len(replies) != expected:
+        raise ValueError(f"Expected a JSON array of {expected} replies")
+    return [str(reply).strip() for reply in replies]
+
+
+async def _complete_batches(
+    batches: List[List[str]],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    max_concurrency: int,
+    timeout: float,
+) -> List[List[Optional[str]]]:
+    """Send all batch requests concurrently, bounded by a semaphore."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    client = openai.AsyncOpenAI(api_key=openai.api_key)
+
+    async def request(batch: List[str]) -> str:
+        async with semaphore:
+            return await asyncio.wait_for(
+                _chat_completion_async(
+                    client,
+                    _render_batch_prompt(batch),
+                    model,
+                    temperature,
+                    max_tokens * len(batch),
+                ),
+                timeout=timeout,
+            )
+
+    async def complete(batch: List[str]) -> List[Optional[str]]:
+        try:
+            content = await request(batch)
+        except Exception as exc:  # includes asyncio.TimeoutError
+            logger.warning(
+                "[⚠️ Warning] Batch of %d prompts failed: %r", len(batch), exc
+            )
+            return [None] * len(batch)
+
+        try:
+            return _parse_batch_response(content, len(batch))
+        except ValueError as exc:
+            if len(batch) == 1:
+                logger.warning("[⚠️ Warning] Unparseable batch reply: %s", exc)
+                return [None]
+
+        # Malformed or miscounted reply: retry each half as its own batch
+        mid = len(batch) // 2
+        first, second = await asyncio.gather(
+            complete(batch[:mid]), complete(batch[mid:])
+        )
+        return first + second
+
+    try:
+        return await asyncio.gather(*(complete(batch) for batch in batches))
+    finally:
+        await client.close()
+
+
+def generate_text_batch(
+    prompts: List[str],
+    model: str = "gpt-3.5-turbo",
+    temperature: float = 0.8,
+    max_tokens: int = 80,
+    batch_size: int = 20,
+    max_concurrency: int = 32,
+    timeout: float = 30.0,
+    cache: bool = False,
+) -> List[Optional[str]]:
+    """
+    Generate text for many prompts, sending one request per batch of prompts.
+
+    Batch requests are issued concurrently (at most max_concurrency in
+    flight). A batch whose reply cannot be parsed is split in half and
+    retried; items whose request fails or times out are returned as None
+    so callers can apply their own fallback pools.
+
+    With cache=True, duplicate prompts are sent only once and successful
+    responses are reused across calls. Leave it off where repeated prompts
+    should yield varied text (e.g. several comments on the same task).
+
+    Args:
+        prompts: Input prompts.
+        model: OpenAI model name.
+        temperature: Sampling temperature.
+        max_tokens: Max tokens to generate per prompt.
+        batch_size: Number of prompts combined into a single request.
+        max_concurrency: Maximum number of requests in flight.
+        timeout: Per-request timeout in seconds.
+        cache: Deduplicate prompts and reuse cached responses.
+
+    Returns:
+        Generated text (or None) for each prompt, in input order.
+    """
+    if not LLM_ENABLED or not _OPENAI_INITIALIZED:
+        return [random_sentence() for _ in prompts]
+
+    if cache:
+        keys = {
+            p: _cache_key(p, model, temperature, max_tokens)
+            for p in dict.fromkeys(prompts)
+        }
+        pending = [p for p, key in keys.items() if _cache_get(key) is None]
+    else:
+        pending = list(prompts)
+
+    if not pending:
+        return [_cache_get(keys[p]) for p in prompts]
+
+    batches = [
+        pending[start : start + batch_size]
+        for start in range(0, len(pending), batch_size)
+    ]
+    replies = asyncio.run(
+        _complete_batches(
+            batches, model, temperature, max_tokens, max_concurrency, timeout
+        )
+    )
+    texts = [text for batch in replies for text in batch]
+
+    if not cache:
+        return texts
+
+    _cache_put_many(
+        (keys[prompt], text)
+        for prompt, text in zip(pending, texts)
+        if text is not None
+    )
+    fresh = dict(zip(pending, texts))
+    return [fresh[p] if p in fresh else _cache_get(keys[p]) for p in prompts]
+
+
 def safe_generate(prompt: str, retries: int = 3, base_delay: float = 1.0) -> str:
     """
     Safely generate text with retries and exponential backoff.
 
+    Only transient API errors (rate limits, connection failures, timeouts)
+    are retried; any other error falls back to synthetic text immediately.
+
     Args:
         prompt: Input prompt.
-        retries: Number of retry attempts.
+        retries: Number of attempts.
         base_delay: Initial backoff delay in seconds.
 
     Returns:
         Generated text.
     """
+    if not LLM_ENABLED or not _OPENAI_INITIALIZED:
+        return random_sentence()
+
     for attempt in range(retries):
         try:
-            return generate_text(prompt)
+            return _complete(
+                prompt, model="gpt-3.5-turbo", temperature=0.8, max_tokens=80
+            )
+        except _RETRYABLE_ERRORS:
+            if attempt < retries - 1:
+                time.sleep(base_delay * (2**attempt))
         except Exception:
-            time.sleep(base_delay * (2**attempt))
+            break
 
     return random_sentence()
 
 
+async def _safe_generate_all(
+    prompts: List[str],
+    max_concurrency: int,
+) -> List[str]:
+    """Run generate_text_async for every prompt on one shared client."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    client = openai.AsyncOpenAI(api_key=openai.api_key)
+
+    async def generate(prompt: str) -> str:
+        async with semaphore:
+            return await generate_text_async(prompt, client=client)
+
+    try:
+        return await asyncio.gather(*(generate(prompt) for prompt in prompts))
+    finally:
+        await client.close()
+
+
+def safe_generate_batch(prompts: List[str], max_concurrency: int = 8) -> List[str]:
+    """
+    Generate text for many prompts concurrently, one request per prompt.
+
+    Unlike generate_text_batch, prompts are not combined into a single
+    request, so each reply is independent of the others. Any prompt whose
+    request fails falls back to synthetic text.
+
+    Args:
+        prompts: Input prompts.
+        max_concurrency: Maximum number of requests in flight.
+
+    Returns:
+        Generated text for each prompt, in input order.
+    """
+    if not LLM_ENABLED or not _OPENAI_INITIALIZED:
+        return [random_sentence() for _ in prompts]
+
+    return asyncio.run(_safe_generate_all(list(prompts), max_concurrency))
+
+
 def load_prompts(file_path: str) -> List[str]:
     """
     Load prompt templates from a text file.
@@ -152,13 +584,15 @@ def generate_from_template(template: str, variables: Dict[str, str]) -> str:
     Returns:
         Rendered string.
     """
-    result = template
-    for key, value in variables.items():
-        result = result.replace(f"{{{key}}}", str(value))
-    return result
+    return _PLACEHOLDER.sub(
+        lambda match: str(variables.get(match.group(1), match.group(0))),
+        template,
+    )
 
 
 if __name__ == "__main__":
+    from tqdm import tqdm  # ✅ ADDED
+
     print("=== llm_helper demo ===")
 
     init_openai()
@@ -169,7 +603,9 @@ if __name__ == "__main__":
         "Describe a marketing project focused on lead generation.",
     ]
 
-    for p in tqdm(sample_prompts, desc="Generating LLM text"):  # ✅ UPDATED
-        print("-", safe_generate(p))
+    for text in tqdm(
+        safe_generate_batch(sample_prompts), desc="Generating LLM text"
+    ):  # ✅ UPDATED
+        print("-", text)
 
     print("[✅] llm_helper demo completed successfully.")  # ✅ ADDED
@@ -7,11 +7,16 @@ across generators.
 
 from __future__ import annotations
 
+import os
 import random
 import uuid
-import string
-from typing import Dict
+from bisect import bisect
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+from faker import Faker
 from tqdm import tqdm  # ✅ ADDED
 
 
@@ -51,12 +56,36 @@ _SAMPLE_NOUNS = [
     "system",
 ]
 
+# Pool of single real words used to pad sentences past the verb/adjective/noun
+# core; multi-word entries are split so each draw adds exactly one word
+_FILLER_POOL = tuple(
+    word
+    for entry in _SAMPLE_VERBS + _SAMPLE_ADJECTIVES + _SAMPLE_NOUNS
+    for word in entry.split()
+)
+
 
 def set_seed(seed: int) -> None:
     """Globally set the random seed for reproducibility."""
     random.seed(seed)
 
 
+def seed_all(seed: int) -> np.random.Generator:
+    """
+    Seed every random source used by the generators, once per pipeline run.
+
+    Args:
+        seed: Seed value.
+
+    Returns:
+        A NumPy Generator seeded with the same value.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    Faker.seed(seed)
+    return np.random.default_rng(seed)
+
+
 def generate_uuid(prefix: str | None = None) -> str:
     """
     Generate a UUID4 string, optionally prefixed.
@@ -71,10 +100,86 @@ def generate_uuid(prefix: str | None = None) -> str:
     return f"{prefix}_{uid}" if prefix else uid
 
 
+def generate_uuid_batch(prefix: str | None, n: int) -> List[str]:
+    """
+    Generate many UUID4 strings from a single entropy draw.
+
+    Reads all random bytes with one ``os.urandom`` call instead of one per
+    UUID, then stamps the version/variant bits so the output matches
+    ``generate_uuid``.
+
+    Args:
+        prefix: Optional prefix (e.g., 'att', 'com').
+        n: Number of UUIDs to generate.
+
+    Returns:
+        List of UUID strings, optionally prefixed.
+    """
+    if n <= 0:
+        return []
+
+    raw = np.frombuffer(bytearray(os.urandom(16 * n)), dtype=np.uint8).reshape(n, 16)
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+
+    hex_digits = raw.tobytes().hex()
+    head = f"{prefix}_" if prefix else ""
+    return [
+        f"{head}{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+        for h in (hex_digits[i : i + 32] for i in range(0, 32 * n, 32))
+    ]
+
+
+class WeightedSampler:
+    """
+    Reusable weighted sampler over a fixed item -> weight table.
+
+    Cumulative weights are computed once, so each draw costs one random
+    number and one bisect instead of rebuilding the distribution.
+    """
+
+    __slots__ = ("items", "cum_weights", "total")
+
+    def __init__(self, choices: Dict[str, int]) -> None:
+        """
+        Build the sampler.
+
+        Args:
+            choices: Mapping of item -> weight.
+        """
+        if not choices:
+            raise ValueError("Choices dictionary cannot be empty")
+
+        self.items = tuple(choices)
+        self.cum_weights = tuple(accumulate(choices.values()))
+        self.total = self.cum_weights[-1]
+
+    def sample(self) -> str:
+        """
+        Draw one item.
+
+        Returns:
+            Selected item based on weights.
+        """
+        # Same draw as random.choices(items, weights, k=1)
+        return self.items[bisect(self.cum_weights, random.random() * self.total)]
+
+
+@lru_cache(maxsize=128)
+def _cached_sampler(items: Tuple[Tuple[str, int], ...]) -> WeightedSampler:
+    """Build a sampler once per distinct weight table."""
+    return WeightedSampler(dict(items))
+
+
 def weighted_choice(choices: Dict[str, int]) -> str:
     """
     Perform a weighted random selection.
 
+    A WeightedSampler is built once per distinct weight table and reused,
+    but every call still builds and hashes a key from the whole mapping,
+    so each draw is O(k) in the number of choices. Hot loops should build
+    a WeightedSampler once and call its ``sample`` method directly.
+
     Args:
         choices: Mapping of item -> weight.
 
@@ -84,10 +189,7 @@ def weighted_choice(choices: Dict[str, int]) -> str:
     if not choices:
         raise ValueError("Choices dictionary cannot be empty")
 
-    items = list(choices.keys())
-    weights = list(choices.values())
-
-    return random.choices(items, weights=weights, k=1)[0]
+    return _cached_sampler(tuple(choices.items())).sample()
 
 
 def random_bool(probability_true: float = 0.5) -> bool:
@@ -106,6 +208,33 @@ def random_bool(probability_true: float = 0.5) -> bool:
     return random.random() < probability_true
 
 
+def random_user_ids(
+    users: List[Dict],
+    size: int,
+    probability_assigned: float = 0.8,
+) -> List[Optional[str]]:
+    """
+    Draw an optional assignee per row, all at once.
+
+    Args:
+        users: Candidate users (dicts with a ``user_id`` key).
+        size: Number of rows.
+        probability_assigned: Probability a row gets a user.
+
+    Returns:
+        User ID (or None) for each row.
+    """
+    if not users:
+        return [None] * size
+
+    assign_mask = (np.random.random(size) < probability_assigned).tolist()
+    user_idx = np.random.randint(0, len(users), size=size).tolist()
+    return [
+        users[i]["user_id"] if assigned else None
+        for assigned, i in zip(assign_mask, user_idx)
+    ]
+
+
 def random_sentence(words_min: int = 5, words_max: int = 12) -> str:
     """
     Generate a randomly structured sentence.
@@ -127,16 +256,14 @@ def random_sentence(words_min: int = 5, words_max: int = 12) -> str:
     noun = random.choice(_SAMPLE_NOUNS)
 
     core_phrase = f"{verb} {adjective} {noun}"
+    core_words = 3 + noun.count(" ")
 
     remaining_words = random.randint(
-        max(0, words_min - len(core_phrase.split())),
-        max(0, words_max - len(core_phrase.split())),
+        max(0, words_min - core_words),
+        max(0, words_max - core_words),
     )
 
-    filler = random.choices(
-        list(string.ascii_lowercase),
-        k=remaining_words,
-    )
+    filler = random.choices(_FILLER_POOL, k=remaining_words)
 
     sentence = " ".join([core_phrase] + filler).capitalize()
     return f"{sentence}."